@@ -0,0 +1,164 @@
+"""
+Caching utilities, with statistics about cache hits and misses that can be
+inspected (e.g., when profiling) via `cache_stats`.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from threading import Lock
+from typing import Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    """
+    Number of hits and misses of a cache.
+    """
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups that were hits (0 when there was no lookup).
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def reset(self):
+        """
+        Resets the counters to zero.
+        """
+        self.hits = 0
+        self.misses = 0
+
+
+_stats: Dict[str, CacheStats] = {}
+_caches: Dict[str, "LRUCache"] = {}
+
+
+def register_stats(name: str) -> CacheStats:
+    """
+    Returns the statistics for the cache with the given name, creating them
+    when they do not exist yet.
+
+    :param name: name of the cache
+    :returns: the statistics of the cache
+    """
+    return _stats.setdefault(name, CacheStats())
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """
+    Returns the statistics of all the caches, indexed by their name.
+
+    :returns: a dictionary from cache names to their statistics
+    """
+    return dict(_stats)
+
+
+def reset_cache_stats():
+    """
+    Resets the statistics of all the caches.
+    """
+    for stats in _stats.values():
+        stats.reset()
+
+
+def set_cache_capacity(name: str, capacity: int):
+    """
+    Changes the maximum number of values held by the cache with the given
+    name, evicting the least recently used values that no longer fit.
+
+    :param name: name of the cache (as in `cache_stats`)
+    :param capacity: the new capacity of the cache
+    """
+    _caches[name].set_capacity(capacity)
+
+
+def cached_method(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator to compute the result of a method without parameters at most
+    once per instance. The result is stored in the instance (which can be a
+    frozen dataclass), and hits and misses are counted in the statistics of a
+    cache named after the method.
+    """
+    attribute = f"_cached_{method.__name__}"
+    stats = register_stats(method.__qualname__)
+
+    @wraps(method)
+    def wrapper(self):
+        try:
+            value = self.__dict__[attribute]
+        except KeyError:
+            stats.misses += 1
+            value = method(self)
+            object.__setattr__(self, attribute, value)
+            return value
+        stats.hits += 1
+        return value
+    return wrapper
+
+
+class LRUCache(Generic[T]):
+    """
+    A cache holding at most `capacity` values: when full, the least recently
+    used value is evicted. Its statistics are registered under its name.
+    """
+
+    def __init__(self, name: str, capacity: int):
+        self.capacity = capacity
+        self.stats = register_stats(name)
+        self._values: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._lock = Lock()
+        _caches[name] = self
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Returns the value for the given key, computing (and caching) it when
+        it is not in the cache.
+
+        :param key: the key of the value
+        :param compute: function computing the value when it is missing
+        :returns: the value for the key
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self.stats.hits += 1
+                self._values.move_to_end(key)
+                return value
+            self.stats.misses += 1
+        value = compute()
+        with self._lock:
+            self._values[key] = value
+            self._evict()
+        return value
+
+    def set_capacity(self, capacity: int):
+        """
+        Changes the maximum number of values held by this cache, evicting the
+        least recently used values that no longer fit.
+
+        :param capacity: the new capacity
+        """
+        with self._lock:
+            self.capacity = capacity
+            self._evict()
+
+    def _evict(self):
+        while len(self._values) > self.capacity:
+            self._values.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all the values from the cache.
+        """
+        with self._lock:
+            self._values.clear()
@@ -2,13 +2,11 @@
 `Color` type, functions to produce colors, and constants for important colors.
 """
 
-from dataclasses import dataclass
 from typing import Tuple
 
 from skia import Color4f
 
 
-@dataclass
 class Color:
     """
     Represents a color.
@@ -17,10 +15,48 @@ class Color:
     to completely opaque (like the color `red`).
     """
 
-    color: Color4f
+    # A color is immutable, and it is stored compactly as a 32-bit integer
+    # with 8 bits for each component: alpha, red, green, blue.
+    __slots__ = ("_argb",)
+    _argb: int
 
     def __init__(self, red: int, green: int, blue: int, alpha: float):
-        self.color = Color4f(red / 255, green / 255, blue / 255, alpha)
+        argb = (_to_byte(alpha * 255) << 24 | _to_byte(red) << 16 |
+                _to_byte(green) << 8 | _to_byte(blue))
+        object.__setattr__(self, "_argb", argb)
+
+    @classmethod
+    def from_argb(cls, argb: int) -> "Color":
+        """
+        Creates a color from its components packed into a 32-bit integer
+        (8 bits for each component: alpha, red, green, blue).
+
+        :meta private:
+        :param argb: the packed components
+        :returns: the color
+        """
+        color = cls.__new__(cls)
+        object.__setattr__(color, "_argb", int(argb))
+        return color
+
+    @property
+    def argb(self) -> int:
+        """
+        The components of the current color packed into a 32-bit integer
+        (8 bits for each component: alpha, red, green, blue).
+
+        :meta private:
+        """
+        return self._argb
+
+    @property
+    def color(self) -> Color4f:
+        """
+        The current color as a Skia color (created on each access).
+
+        :meta private:
+        """
+        return Color4f.FromColor(self._argb)
 
     def as_tuple(self) -> Tuple[int, int, int, float]:
         """
@@ -30,4 +66,38 @@ class Color:
         :returns: a tuple with four components. The first three [0-255] identify the
                   color, the last one [0-1] identifies the transparency
         """
-        return self.color[0] * 255, self.color[1] * 255, self.color[2] * 255, self.color[3]
+        argb = self._argb
+        return (argb >> 16) & 0xFF, (argb >> 8) & 0xFF, argb & 0xFF, (argb >> 24) / 255
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Color):
+            return self._argb == other._argb
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._argb)
+
+    def __repr__(self) -> str:
+        red, green, blue, alpha = self.as_tuple()
+        return f"Color(red={red}, green={green}, blue={blue}, alpha={alpha})"
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Colors are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Colors are immutable")
+
+    def __reduce__(self):
+        return Color, self.as_tuple()
+
+
+def _to_byte(component: float) -> int:
+    """
+    Rounds a color component in the range [0-255] to an integer.
+    Components outside of the range are clamped, as they would be when
+    drawing, so that they never affect the other components.
+
+    :param component: the component
+    :returns: the rounded component, in the range [0-255]
+    """
+    return min(max(int(component + 0.5), 0), 255)
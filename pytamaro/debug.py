@@ -2,14 +2,17 @@
 Functions to enrich a graphic with information useful for debugging purposes.
 """
 
+from functools import lru_cache
+
 from skia import Point
 
 from pytamaro.color import Color
 from pytamaro.color_functions import rgb_color
-from pytamaro.graphic import Graphic
+from pytamaro.display_list import graphic_picture
+from pytamaro.graphic import Graphic, Pin
 from pytamaro.operations import (compose, graphic_height, graphic_width,
                                  overlay, pin, rotate)
-from pytamaro.point_names import bottom_left, top_left
+from pytamaro.point_names import bottom_left, center, top_left
 from pytamaro.primitives import rectangle
 
 
@@ -35,7 +38,9 @@ def add_debug_info(graphic: Graphic) -> Graphic:
     relative_pin_pos = graphic.pin_position - top_left_point(graphic)
     border_thickness = 5
     border_color = rgb_color(240, 16, 16)
-    g_with_border = add_border(graphic, border_thickness, border_color)
+    # Wrap the graphic with the border in a new node (rather than an interned,
+    # potentially shared, one) as its pinning position is going to be moved.
+    g_with_border = Pin(add_border(graphic, border_thickness, border_color), center)
     new_rel_pin_pos = relative_pin_pos + (border_thickness, border_thickness)
     new_abs_pin_pos = top_left_point(g_with_border) + new_rel_pin_pos
     object.__setattr__(g_with_border, "pin_position", new_abs_pin_pos)
@@ -69,6 +74,19 @@ def show_pin_position(graphic: Graphic) -> Graphic:
     :param graphic: original graphic
     :returns: the graphic with the highlighted pin position
     """
+    return compose(_cross(), graphic)
+
+
+@lru_cache(maxsize=None)
+def _cross() -> Graphic:
+    """
+    Returns the yellowish cross used to show the pin position.
+    The cross is the same for all graphics: it is built and recorded only
+    once, so that its picture gets replayed in each visualization.
+
+    :returns: the cross
+    """
     arm = rectangle(35, 5, rgb_color(250, 200, 0))
     cross = rotate(45, compose(arm, rotate(90, arm)))
-    return compose(cross, graphic)
+    graphic_picture(cross)
+    return cross
@@ -0,0 +1,322 @@
+"""
+Compilation of graphics into display lists: flat sequences of drawing
+operations that can be replayed onto any canvas without walking the tree
+that represents a graphic.
+"""
+
+from array import array
+from typing import List, Optional, Set, Union
+
+from skia import (Canvas, Matrix, Paint, Path, Picture, PictureRecorder, Rect,
+                  TextBlob)
+
+from pytamaro.cache import register_stats
+from pytamaro.graphic import _PICTURE, Graphic, Primitive, Text, culling_stats
+
+# Number of coefficients stored for each (affine) matrix.
+_AFFINE_SIZE = 6
+
+
+class DisplayList:
+    """
+    A graphic compiled into a flat sequence of operations, each one drawing
+    either a path (of one or more primitives) filled with a paint, a text
+    drawn natively with a paint, or a picture (a recorded subtree of the
+    graphic), after applying a transformation matrix (relative to the
+    top-left corner of the coordinate space of the graphic, not of its
+    bounds).
+
+    Matrices are stored as affine coefficients in a single array, paths and
+    paints as references to those of the primitive graphics. The bounds of
+    what each operation draws (in the same coordinate space) are stored in
+    another array, so that operations outside of the clip can be skipped.
+    """
+
+    def __init__(self, bounds: Rect):
+        self.bounds = bounds
+        self._matrices = array("f")
+        self._bounds = array("f")
+        self._drawables: List[Union[Path, TextBlob, Picture]] = []
+        self._paints: List[Optional[Paint]] = []
+        self._picture: Optional[Picture] = None
+
+    def __len__(self) -> int:
+        return len(self._drawables)
+
+    def _append(self, drawable: Union[Path, TextBlob, Picture], paint: Optional[Paint],
+                matrix: Matrix, bounds: Rect):
+        """
+        Appends an operation to this display list.
+
+        :param drawable: path to fill, text to draw or picture to draw
+        :param paint: paint to fill the path or draw the text with (None for a
+               picture)
+        :param matrix: transformation to apply to the path or picture
+        :param bounds: bounds of what the operation draws (after applying the
+               transformation)
+        """
+        self._matrices.extend(matrix.get9()[:_AFFINE_SIZE])
+        self._bounds.extend((bounds.left(), bounds.top(), bounds.right(), bounds.bottom()))
+        self._drawables.append(drawable)
+        self._paints.append(paint)
+
+    def draw(self, canvas: Canvas):
+        """
+        Replays this display list onto the provided canvas, on top of the
+        transformation currently set on the canvas (e.g., a scale).
+        Operations that draw entirely outside of the clip of the canvas are
+        skipped (culled).
+
+        :param canvas: canvas onto which to draw
+        """
+        all_bounds = self._bounds
+        # Already outset to account for pixels partially covered by what is drawn.
+        clip_left, clip_top, clip_right, clip_bottom = tuple(canvas.getLocalClipBounds())
+        culled = 0
+        for index in range(len(self)):
+            left, top, right, bottom = all_bounds[4 * index:4 * index + 4]
+            if left >= clip_right or right <= clip_left or \
+                    top >= clip_bottom or bottom <= clip_top:
+                culled += 1
+            else:
+                self._draw_operation(canvas, index)
+        culling_stats.hits += culled
+        culling_stats.misses += len(self) - culled
+
+    def _draw_operation(self, canvas: Canvas, index: int):
+        """
+        Draws one of the operations of this display list onto the provided
+        canvas.
+
+        :param canvas: canvas onto which to draw
+        :param index: index of the operation
+        """
+        offset = index * _AFFINE_SIZE
+        scale_x, skew_x, trans_x, skew_y, scale_y, trans_y = \
+            self._matrices[offset:offset + _AFFINE_SIZE]
+        drawable, paint = self._drawables[index], self._paints[index]
+        canvas.save()
+        if scale_x == 1 and skew_x == 0 and skew_y == 0 and scale_y == 1:
+            canvas.translate(trans_x, trans_y)
+        else:
+            canvas.concat(Matrix.MakeAll(scale_x, skew_x, trans_x,
+                                         skew_y, scale_y, trans_y, 0, 0, 1))
+        if paint is None:
+            canvas.drawPicture(drawable)
+        elif isinstance(drawable, TextBlob):
+            canvas.drawTextBlob(drawable, 0, 0, paint)
+        else:
+            canvas.drawPath(drawable, paint)
+        canvas.restore()
+
+    def picture(self) -> Picture:
+        """
+        Records this display list into a picture, which can be drawn (even
+        multiple times) without executing Python code for each operation.
+        The picture is recorded only once.
+
+        :returns: the picture for this display list
+        """
+        if self._picture is None:
+            recorder = PictureRecorder()
+            self.draw(recorder.beginRecording(self.bounds))
+            self._picture = recorder.finishRecordingAsPicture()
+        return self._picture
+
+
+class _Batch:
+    """
+    Consecutive primitives, filled with the same paint, that can be merged into
+    a single path without changing the result of drawing them in order.
+    This is the case when their bounds do not intersect: there is no area that
+    would be painted twice (which matters for translucent paints) or where
+    paths with opposite directions would cancel each other out.
+    """
+
+    def __init__(self, path: Path, paint: Paint, matrix: Matrix, bounds: Rect):
+        self.path = path
+        self.paint = paint
+        self.matrix = matrix
+        self.bounds = bounds
+        self.merged = False
+
+    def add(self, path: Path, paint: Paint, matrix: Matrix, bounds: Rect) -> bool:
+        """
+        Tries to add a primitive to this batch.
+
+        :param path: path of the primitive
+        :param paint: paint of the primitive
+        :param matrix: transformation to apply to the path
+        :param bounds: (mapped) bounds of the primitive
+        :returns: whether the primitive could be added
+        """
+        if (paint is not self.paint and paint != self.paint) or \
+                Rect.Intersects(self.bounds, bounds):
+            return False
+        if not self.merged:
+            # Do not modify the path of the first primitive, but a copy.
+            merged_path = Path()
+            merged_path.addPath(self.path, self.matrix)
+            self.path = merged_path
+            self.matrix = Matrix()
+            self.merged = True
+        self.path.addPath(path, matrix)
+        self.bounds.join(bounds)
+        return True
+
+    def append_to(self, display_list: DisplayList):
+        """
+        Appends the operation filling this batch to a display list.
+
+        :param display_list: the display list
+        """
+        # pylint: disable-next=protected-access
+        display_list._append(self.path, self.paint, self.matrix, self.bounds)
+
+
+# Attribute of a graphic where its compiled display list is stored.
+_DISPLAY_LIST = "_display_list"
+# Attribute of a graphic set when it is drawn (by `draw_graphic`) the first time.
+_DRAWN = "_drawn"
+_compiled_stats = register_stats("compile_graphic")
+
+
+def graphic_picture(graphic: Graphic) -> Picture:
+    """
+    Records a graphic into a picture, which can be drawn (even multiple
+    times) without executing Python code for each of its primitives.
+    The picture is the one of the display list of the graphic (see
+    `compile_graphic`), where primitives are merged into fewer paths than
+    the tree of the graphic would draw.
+    The picture is recorded only once, and stored in the graphic.
+
+    :param graphic: graphic to record
+    :returns: the picture for the graphic
+    """
+    picture = getattr(graphic, _PICTURE, None)
+    if picture is None:
+        picture = compile_graphic(graphic).picture()
+        object.__setattr__(graphic, _PICTURE, picture)
+    return picture
+
+
+def draw_graphic(canvas: Canvas, graphic: Graphic):
+    """
+    Draws a graphic onto a canvas, as done when showing or saving it.
+
+    The first time, the tree of the graphic is drawn directly: compiling
+    and recording it would only pay off when drawing it again. From the
+    second time on, the picture of its display list is replayed (see
+    `graphic_picture`).
+
+    :param canvas: canvas onto which to draw
+    :param graphic: graphic to be drawn
+    """
+    if getattr(graphic, _DRAWN, False) or \
+            getattr(graphic, _PICTURE, None) is not None:
+        canvas.drawPicture(graphic_picture(graphic))
+    else:
+        object.__setattr__(graphic, _DRAWN, True)
+        graphic.draw(canvas)
+
+
+def compile_graphic(graphic: Graphic) -> DisplayList:
+    """
+    Compiles a graphic into a display list, walking its tree only once.
+
+    Consecutive primitives with the same paint and disjoint bounds are
+    merged into a single path, which gets filled with a single operation.
+    Subtrees that appear multiple times in the graphic (e.g., the same tile
+    in a grid), or that have already been compiled or recorded, are
+    recorded into a picture once (see `graphic_picture`), and then replayed
+    at each of their positions.
+    The display list is stored in the graphic: compiling the same graphic
+    again returns the same display list.
+
+    :param graphic: graphic to compile
+    :returns: the display list for the graphic
+    """
+    display_list = getattr(graphic, _DISPLAY_LIST, None)
+    if display_list is not None:
+        _compiled_stats.hits += 1
+        return display_list
+    _compiled_stats.misses += 1
+    display_list = DisplayList(graphic.bounds())
+    batch: Optional[_Batch] = None
+    seen: Set[int] = set()
+    # Walk the tree without recursion, as graphics can be deeply nested.
+    stack = [(graphic, Matrix())]
+    while stack:
+        node, matrix = stack.pop()
+        # pylint: disable-next=protected-access
+        children = node._children()
+        # Go straight through the graphics that just wrap another one (e.g.,
+        # pinned graphics), unless they have been compiled already.
+        while len(children) == 1 and children[0][1] is None and \
+                getattr(node, _DISPLAY_LIST, None) is None:
+            node = children[0][0]
+            children = node._children()  # pylint: disable=protected-access
+        if not children:
+            if isinstance(node, Primitive):
+                batch = _compile_primitive(display_list, batch, node, matrix)
+        elif id(node) in seen or \
+                getattr(node, _DISPLAY_LIST, None) is not None or \
+                getattr(node, _PICTURE, None) is not None:
+            bounds = node._tight_bounds  # pylint: disable=protected-access
+            # Subtrees without any point draw nothing.
+            if bounds is None:
+                continue
+            _flush(batch, display_list)
+            batch = None
+            # pylint: disable-next=protected-access
+            display_list._append(graphic_picture(node), None, matrix, matrix.mapRect(bounds))
+        else:
+            seen.add(id(node))
+            # Push in reverse order so that the background comes first.
+            for child, transform in reversed(children):
+                stack.append((child, matrix if transform is None
+                              else Matrix.Concat(matrix, transform)))
+    _flush(batch, display_list)
+    object.__setattr__(graphic, _DISPLAY_LIST, display_list)
+    return display_list
+
+
+def _compile_primitive(display_list: DisplayList, batch: Optional[_Batch],
+                       primitive: Primitive, matrix: Matrix) -> Optional[_Batch]:
+    """
+    Compiles a primitive into a display list, adding it to the current batch
+    of primitives when possible.
+
+    :param display_list: the display list being compiled
+    :param batch: the current batch (None if there is none)
+    :param primitive: the primitive
+    :param matrix: transformation to apply to the primitive
+    :returns: the batch to which the next primitives can be added
+    """
+    bounds = primitive._tight_bounds  # pylint: disable=protected-access
+    # Primitives without any point (e.g., a space) draw nothing.
+    if bounds is None:
+        return batch
+    paint = primitive.paint
+    # Exact for translations, containing the transformed bounds otherwise.
+    bounds = matrix.mapRect(bounds)
+    if isinstance(primitive, Text) and primitive.native:
+        _flush(batch, display_list)
+        # pylint: disable-next=protected-access
+        display_list._append(primitive.blob, paint, matrix, bounds)
+        return None
+    if batch is not None and batch.add(primitive.path, paint, matrix, bounds):
+        return batch
+    _flush(batch, display_list)
+    return _Batch(primitive.path, paint, matrix, bounds)
+
+
+def _flush(batch: Optional[_Batch], display_list: DisplayList):
+    """
+    Appends the operation filling a batch (if any) to a display list.
+
+    :param batch: the batch (None if there is none)
+    :param display_list: the display list
+    """
+    if batch is not None:
+        batch.append_to(display_list)
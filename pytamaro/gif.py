@@ -0,0 +1,178 @@
+"""
+Incremental writing of animated GIF files, one frame at a time.
+
+Pillow can only save an animation given all its frames at once, and it keeps
+all of them in memory while saving. `GifWriter` produces the same file while
+keeping at most two frames in memory, relying on the functions that Pillow
+itself uses to write each part of a GIF file.
+
+These functions are private, and might be missing or behave differently in
+other versions of Pillow. Upon import, a small animation is written with them
+and compared with the one saved by Pillow: when anything fails or differs,
+`GifWriter` falls back to keeping all the frames and saving them at once.
+"""
+
+from io import BytesIO
+from typing import BinaryIO, List, Optional, Tuple
+
+from PIL import GifImagePlugin, ImageChops
+from PIL import Image as PILImageMod
+from PIL.Image import Image as PILImage
+
+
+def _palette_bytes(image: PILImage) -> bytes:
+    """
+    Returns the palette of an image, like Pillow does when comparing frames.
+
+    :param image: the image
+    :returns: the bytes of the palette (empty when there is none)
+    """
+    return bytes(image.palette.palette) if image.palette else b""
+
+
+def _frame_bbox(previous: PILImage, frame: PILImage) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Computes the bounding box of the area that differs between two frames.
+
+    :param previous: the previous frame
+    :param frame: the current frame
+    :returns: the bounding box, or None when the frames are identical
+    """
+    if _palette_bytes(previous) == _palette_bytes(frame):
+        delta = ImageChops.subtract_modulo(frame, previous)
+    else:
+        delta = ImageChops.subtract_modulo(frame.convert("RGB"), previous.convert("RGB"))
+    return delta.getbbox()
+
+
+class GifWriter:
+    """
+    Writes an animated GIF file frame by frame, producing the same file as
+    Pillow's `save` with `save_all=True`: frames after the first one only
+    store the area that changed, and identical consecutive frames are merged
+    into one (adding up their durations).
+
+    A frame is written once the next one is known to be different, hence
+    at most two frames are held in memory (unless frames are not written
+    incrementally, in which case all of them are saved by Pillow when closing
+    the writer).
+    """
+
+    def __init__(self, file: BinaryIO, duration: int, loop: int,
+                 incremental: Optional[bool] = None):
+        """
+        :param file: binary file to write to
+        :param duration: duration in milliseconds for each frame
+        :param loop: number of times the animation loops (0 for indefinitely)
+        :param incremental: whether to write frames incrementally (by default,
+               when `INCREMENTAL` is true)
+        """
+        self._file = file
+        self._info = {"duration": duration, "loop": loop, "optimize": True}
+        # Kept until a second, different frame arrives.
+        self._first: Optional[PILImage] = None
+        self._frames = 0
+        self._pending: Optional[Tuple[PILImage, Optional[Tuple[int, int, int, int]], dict]] = None
+        self._written = 0
+        if incremental is None:
+            incremental = INCREMENTAL
+        # All the frames, only kept when not writing them incrementally.
+        self._images: Optional[List[PILImage]] = None if incremental else []
+
+    def write(self, image: PILImage):
+        """
+        Adds a frame to the animation.
+
+        :param image: the frame
+        """
+        if self._images is not None:
+            self._images.append(image)
+            return
+        # pylint: disable=protected-access
+        frame = GifImagePlugin._normalize_mode(image.copy())
+        self._frames += 1
+        if self._frames == 1:
+            self._first = image
+            for key, value in frame.info.items():
+                if key != "transparency":
+                    self._info.setdefault(key, value)
+        info = self._info.copy()
+        frame = GifImagePlugin._normalize_palette(frame, None, info)
+        if "transparency" in frame.info:
+            info.setdefault("transparency", frame.info["transparency"])
+        bbox = None
+        if self._pending is not None:
+            previous, _, previous_info = self._pending
+            bbox = _frame_bbox(previous, frame)
+            if not bbox:
+                # Identical to the previous frame: show that one for longer.
+                if info.get("duration"):
+                    previous_info["duration"] += info["duration"]
+                return
+            self._write_pending()
+        self._pending = (frame, bbox, info)
+
+    def _write_pending(self):
+        # pylint: disable=protected-access
+        frame, bbox, info = self._pending  # type: ignore
+        if not bbox:
+            for data in GifImagePlugin._get_global_header(frame, info):
+                self._file.write(data)
+            offset = (0, 0)
+        else:
+            info["include_color_table"] = True
+            frame = frame.crop(bbox)
+            offset = bbox[:2]
+        GifImagePlugin._write_frame_data(self._file, frame, offset, info)
+        self._written += 1
+        self._pending = None
+        self._first = None
+
+    def close(self):
+        """
+        Writes the last frame and the end of the file.
+        """
+        if self._images is not None:
+            self._images[0].save(self._file, format="GIF", save_all=True,
+                                 append_images=self._images[1:],
+                                 duration=self._info["duration"], loop=self._info["loop"])
+            return
+        if self._written == 0:
+            # A single (distinct) frame: Pillow writes a still image.
+            assert self._first is not None
+            self._first.save(self._file, format="GIF", save_all=True,
+                             duration=self._info["duration"], loop=self._info["loop"])
+            return
+        self._write_pending()
+        self._file.write(b";")
+        self._file.flush()
+
+
+def _same_as_pillow() -> bool:
+    """
+    Checks whether writing a small animation incrementally produces the same
+    file as Pillow's `save` with `save_all=True`.
+
+    :returns: True when the files are the same, False when they differ or
+              writing incrementally fails
+    """
+    background = PILImageMod.new("RGBA", (4, 4))
+    frames = [background, background.copy(), background.copy()]
+    frames[1].paste((255, 0, 0, 255), (0, 0, 2, 2))
+    frames[2].paste((0, 0, 255, 128), (1, 1, 4, 3))
+    frames.insert(2, frames[1])
+    saved, written = BytesIO(), BytesIO()
+    try:
+        frames[0].save(saved, format="GIF", save_all=True, append_images=frames[1:],
+                       duration=40, loop=0)
+        writer = GifWriter(written, 40, 0, incremental=True)
+        for frame in frames:
+            writer.write(frame)
+        writer.close()
+    except Exception:  # pylint: disable=broad-except
+        return False
+    return written.getvalue() == saved.getvalue()
+
+
+# Whether GifWriter writes frames incrementally by default.
+INCREMENTAL = _same_as_pillow()
@@ -2,17 +2,152 @@
 Type `Graphic`, that includes a graphic with a pinning position.
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from abc import ABC
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Set, Tuple, Type, TypeVar
+from weakref import WeakValueDictionary
 
-from skia import Canvas, Font, Matrix, Paint, Path, Point, Rect, Size, Typeface
+from skia import (Canvas, Font, FontHinting, Matrix, Paint, Path, Picture,
+                  PictureRecorder, Point, Rect, Size, TextBlob, Typeface)
 
+from pytamaro.cache import LRUCache, cached_method, register_stats
 from pytamaro.color import Color
 from pytamaro.point import Point as PyTamaroPoint
 from pytamaro.point_names import (bottom_center, center, center_left,
                                   center_right, top_center)
 
 
+def _path_bounds(path: Path) -> Optional[Rect]:
+    """
+    Computes the tight bounds of a path.
+
+    :param path: the path
+    :returns: the bounds of the path, or None if the path has no points
+    """
+    if path.countPoints() == 0:
+        return None
+    return path.computeTightBounds()
+
+
+def _offset_bounds(bounds: Optional[Rect], offset_x: float,
+                   offset_y: float) -> Optional[Rect]:
+    """
+    Translates the given bounds.
+
+    :param bounds: the bounds to translate (None for no bounds)
+    :param offset_x: horizontal offset
+    :param offset_y: vertical offset
+    :returns: the translated bounds
+    """
+    if bounds is None:
+        return None
+    return bounds.makeOffset(offset_x, offset_y)
+
+
+def _union_bounds(first: Optional[Rect], second: Optional[Rect]) -> Optional[Rect]:
+    """
+    Computes the smallest bounds containing both the given ones.
+    Differently from `Rect.join`, bounds with no area (e.g., those of a
+    rectangle with zero width) are not ignored.
+
+    :param first: first bounds (None for no bounds)
+    :param second: second bounds (None for no bounds)
+    :returns: the union of the two bounds
+    """
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return Rect.MakeLTRB(min(first.left(), second.left()), min(first.top(), second.top()),
+                         max(first.right(), second.right()),
+                         max(first.bottom(), second.bottom()))
+
+
+# Paints for the primitives, by their color.
+_paints: LRUCache[Paint] = LRUCache("paints", 1024)
+
+# Fonts and typefaces for the texts, by font name (and size).
+_typefaces: LRUCache[Typeface] = LRUCache("typefaces", 16)
+_fonts: LRUCache[Font] = LRUCache("fonts", 64)
+# Outlines of the glyphs, by font name, size and glyph.
+_glyph_paths: LRUCache[Path] = LRUCache("glyph_paths", 4096)
+# Outlines of whole texts, by text, font name and size.
+_text_paths: LRUCache[Path] = LRUCache("text_paths", 1024)
+# Text blobs (shaped glyphs, drawn natively), by text, font name and size.
+_text_blobs: LRUCache[TextBlob] = LRUCache("text_blobs", 1024)
+
+# Number of graphics (or operations of display lists) skipped when drawing,
+# because they lie outside of the clip of the canvas (hits), or drawn (misses).
+culling_stats = register_stats("culling")
+
+# Whether new texts are drawn natively (as text) instead of as outlines.
+_native_text = False  # pylint: disable=invalid-name
+
+# Marker used when drawing, to restore the state of the canvas.
+_RESTORE = object()
+
+# Attribute of a graphic where the picture recorded for it is stored.
+_PICTURE = "_picture"
+
+
+def _culled(canvas: Canvas, graphic: "Graphic") -> bool:
+    """
+    Checks whether a graphic can be skipped when drawing it onto a canvas,
+    either because it draws nothing or because its bounds (mapped by the
+    current transformation) lie entirely outside of the clip of the canvas.
+
+    :param canvas: canvas onto which the graphic would be drawn
+    :param graphic: the graphic
+    :returns: True if the graphic does not need to be drawn
+    """
+    bounds = graphic._tight_bounds  # pylint: disable=protected-access
+    if bounds is None:
+        return True
+    if canvas.quickReject(bounds):
+        culling_stats.hits += 1
+        return True
+    culling_stats.misses += 1
+    return False
+
+
+def _record_picture(graphic: "Graphic") -> Picture:
+    """
+    Records a graphic into a picture, by drawing its tree onto a recorder.
+    The picture is stored in the graphic, so that it gets replayed instead of
+    drawing the graphic again (see `Graphic.draw`).
+
+    :param graphic: graphic to record
+    :returns: the picture for the graphic
+    """
+    recorder = PictureRecorder()
+    graphic.draw(recorder.beginRecording(graphic.bounds()))
+    picture = recorder.finishRecordingAsPicture()
+    object.__setattr__(graphic, _PICTURE, picture)
+    return picture
+
+
+def _replayed(canvas: Canvas, graphic: "Graphic", seen: Set[int]) -> bool:
+    """
+    Replays the picture of a composite graphic onto a canvas, when it has
+    one or when it has been met before while drawing (in which case it is
+    recorded first). Otherwise, the graphic is marked as met.
+
+    :param canvas: canvas onto which to draw
+    :param graphic: the graphic
+    :param seen: identities of the graphics met so far
+    :returns: True if the picture was replayed, False if the graphic needs to
+              be drawn
+    """
+    picture = getattr(graphic, _PICTURE, None)
+    if picture is None:
+        if id(graphic) not in seen:
+            seen.add(id(graphic))
+            return False
+        picture = _record_picture(graphic)
+    canvas.drawPicture(picture)
+    return True
+
+
 @dataclass(frozen=True, eq=False)
 class Graphic(ABC):
     """
@@ -25,7 +160,72 @@ class Graphic(ABC):
       position).
     """
     pin_position: Point
-    path: Path
+    # Set upon construction, and used internally only.
+    _tight_bounds: Optional[Rect] = field(init=False, repr=False)
+    _hash: int = field(init=False, repr=False)
+
+    def __init__(self, pin_position: Point, path: Optional[Path] = None):
+        object.__setattr__(self, "pin_position", pin_position)
+        if path is not None:
+            object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_tight_bounds", self._compute_bounds())
+        # Children already know their hash: hashing the key takes constant time.
+        object.__setattr__(self, "_hash", hash((type(self), self._key())))
+
+    @property
+    def path(self) -> Path:
+        """
+        The path (outline) of this graphic.
+
+        Primitive graphics provide their path upon construction. Composite
+        graphics only merge the paths of their components when the outline is
+        first needed, and then cache it: building a graphic by repeatedly
+        composing smaller ones therefore does not copy paths over and over.
+
+        :returns: the path of this graphic
+        """
+        path = self.__dict__.get("_path")
+        if path is None:
+            path = Path()
+            for graphic, matrix in self._leaves(Matrix(), stop_at_paths=True):
+                path.addPath(graphic.path, matrix)
+            object.__setattr__(self, "_path", path)
+        return path
+
+    def _leaves(self, matrix: Matrix, stop_at_paths: bool = False) \
+            -> Iterator[Tuple["Graphic", Matrix]]:
+        """
+        Iterates over the leaves of the tree representing this graphic, from
+        the background to the foreground, each one with the matrix that maps
+        it into the coordinate space described by `matrix`.
+        The tree is walked without recursion, as graphics can be deeply nested.
+
+        :param matrix: transformation applied to this graphic
+        :param stop_at_paths: whether to consider as leaves also the graphics
+               whose path has already been computed
+        :returns: an iterator over pairs (leaf graphic, matrix)
+        """
+        stack: List[Tuple[Graphic, Matrix]] = [(self, matrix)]
+        while stack:
+            graphic, matrix = stack.pop()
+            children = graphic._children()  # pylint: disable=protected-access
+            if not children or (stop_at_paths and "_path" in graphic.__dict__):
+                yield graphic, matrix
+                continue
+            # Push in reverse order so that the background comes first.
+            for child, transform in reversed(children):
+                stack.append((child, matrix if transform is None
+                              else Matrix.Concat(matrix, transform)))
+
+    def _children(self) -> Tuple[Tuple["Graphic", Optional[Matrix]], ...]:
+        """
+        Returns the graphics this graphic is made of, from the background to
+        the foreground, each one with the transformation (if any) that maps it
+        into the coordinate space of this graphic.
+
+        :returns: a tuple of pairs (child, transformation matrix or None)
+        """
+        return ()
 
     def size(self) -> Size:
         """
@@ -39,21 +239,85 @@ class Graphic(ABC):
 
     def bounds(self) -> Rect:
         """
-        Computes the (tight) bounds for the path (outline) of this graphic.
+        Returns the (tight) bounds for the path (outline) of this graphic.
+        They are computed once, upon construction, from the bounds of the
+        components of this graphic, and copied into a new rectangle each time
+        (which can therefore be modified).
 
         :returns: a rectangle that indicates the bounds of the graphic in the 2D
                   space
         """
-        return self.path.computeTightBounds()
+        bounds = self._tight_bounds
+        if bounds is None:
+            return Rect.MakeEmpty()
+        return Rect.MakeLTRB(bounds.left(), bounds.top(), bounds.right(), bounds.bottom())
+
+    def _compute_bounds(self) -> Optional[Rect]:
+        """
+        Computes the tight bounds of this graphic.
+        By default, they are computed from the path of the graphic.
+
+        :returns: the bounds of the graphic, or None if its outline has no
+                  points at all
+        """
+        return _path_bounds(self.path)
 
-    @abstractmethod
     def draw(self, canvas: Canvas):
         """
         Draws the current graphic onto the provided canvas.
 
+        Primitive graphics draw themselves, while composite ones are drawn by
+        walking their tree with an explicit stack (graphics can be deeply
+        nested), saving, transforming and restoring the canvas around the
+        components that need a transformation.
+        Components whose bounds lie entirely outside of the clip of the
+        canvas are skipped (culled), together with all their components.
+        Components that have been recorded into a picture are replayed
+        instead of drawn. Those appearing more than once (e.g., the same tile
+        in a grid) are recorded when they are met again.
+
         :param canvas: canvas onto which to draw
         """
-
+        # Graphics without any point draw nothing.
+        if self._tight_bounds is None:
+            return
+        # Components only need to be checked when this graphic is not
+        # entirely within the clip (e.g., when drawing a tile).
+        cull = not canvas.getLocalClipBounds().contains(self._tight_bounds)
+        stack: List[Any] = [self]
+        seen: Set[int] = set()
+        while stack:
+            item = stack.pop()
+            if item is _RESTORE:
+                canvas.restore()
+                continue
+            if type(item) is Matrix:  # pylint: disable=unidiomatic-typecheck
+                canvas.save()
+                canvas.concat(item)
+                continue
+            if cull and _culled(canvas, item):
+                continue
+            children = item._children()  # pylint: disable=protected-access
+            # Go straight through the graphics that just wrap another one
+            # (e.g., pinned graphics), which have the same bounds.
+            while len(children) == 1 and children[0][1] is None and \
+                    getattr(item, _PICTURE, None) is None:
+                item = children[0][0]
+                children = item._children()  # pylint: disable=protected-access
+            if not children:
+                if item is not self:
+                    item.draw(canvas)
+                continue
+            if item is not self and _replayed(canvas, item, seen):
+                continue
+            # Push in reverse order so that the background comes first.
+            for child, transform in reversed(children):
+                if transform is None:
+                    stack.append(child)
+                else:
+                    stack.extend((_RESTORE, child, transform))
+
+    @cached_method
     def empty_area(self) -> bool:
         """
         Returns whether this graphic has an empty area (width or height 0) or
@@ -64,16 +328,38 @@ class Graphic(ABC):
         return self.size().isEmpty()
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, Graphic):
-            return self.__hash__() == other.__hash__()
-        return False
+        if self is other:
+            return True
+        if not isinstance(other, Graphic) or self._hash != other._hash:
+            return False
+        # Compare the two trees structurally, without recursion.
+        stack: List[Tuple[Graphic, Graphic]] = [(self, other)]
+        while stack:
+            first, second = stack.pop()
+            if first is second:
+                continue
+            if type(first) is not type(second) or \
+                    first._hash != second._hash:
+                return False
+            for first_part, second_part in zip(first._key(), second._key()):
+                if isinstance(first_part, Graphic):
+                    stack.append((first_part, second_part))
+                elif first_part != second_part:
+                    return False
+        return True
 
     def __hash__(self) -> int:
-        return hash(self._key())
+        return self._hash
 
-    def _key(self):
-        return ((self.pin_position.fX, self.pin_position.fY),
-                self.path.serialize().bytes())
+    def _key(self) -> tuple:
+        """
+        Returns what identifies this graphic, given its type: its parameters
+        and the graphics it is composed of.
+        Two graphics are equal when they have the same type and equal keys.
+
+        :returns: a tuple with the parameters and the children of this graphic
+        """
+        return ()
 
 
 @dataclass(frozen=True, eq=False)
@@ -83,6 +369,8 @@ class Primitive(Graphic):
     Geometric shapes and text are primitive graphics.
     """
     color: Color
+    # Shared by the primitives with the same color.
+    paint: Paint = field(init=False, repr=False)
 
     def __init__(self, path: Path, color: Color, pin_position: Point = None):
         object.__setattr__(self, "color", color)
@@ -90,14 +378,15 @@ class Primitive(Graphic):
             bounds = path.computeTightBounds()
             pin_position = Point(bounds.width() / 2, bounds.height() / 2)
         super().__init__(pin_position, path)
-        paint = Paint(color.color)
+        # Primitives with the same color share the same paint.
+        paint = _paints.get(color, lambda: Paint(color.color))
         object.__setattr__(self, "paint", paint)
 
     def draw(self, canvas: Canvas):
-        canvas.drawPath(self.path, self.paint)  # type: ignore  # pylint: disable=no-member
+        canvas.drawPath(self.path, self.paint)
 
-    def _key(self):
-        return super()._key(), self.paint.getHash()  # type: ignore  # pylint: disable=no-member
+    def _key(self) -> tuple:
+        return (self.color,)
 
 
 @dataclass(frozen=True, eq=False)
@@ -127,6 +416,9 @@ class Rectangle(Primitive):
         path = Path().addRect(Rect.MakeWH(width, height))
         super().__init__(path, color)
 
+    def _key(self):
+        return super()._key() + (self.width, self.height)
+
 
 @dataclass(frozen=True, eq=False)
 class Ellipse(Primitive):
@@ -142,6 +434,9 @@ class Ellipse(Primitive):
         path = Path().addOval(Rect.MakeWH(width, height))
         super().__init__(path, color)
 
+    def _key(self):
+        return super()._key() + (self.width, self.height)
+
 
 @dataclass(frozen=True, eq=False)
 class CircularSector(Primitive):
@@ -165,6 +460,9 @@ class CircularSector(Primitive):
             path.close()
         super().__init__(path, color, Point(radius, radius))
 
+    def _key(self):
+        return super()._key() + (self.radius, self.angle)
+
 
 @dataclass(frozen=True, eq=False)
 class Triangle(Primitive):
@@ -189,6 +487,9 @@ class Triangle(Primitive):
         centroid = Point((side1 + third_point.x()) / 3, third_point.y() / 3)
         super().__init__(path, color, centroid)
 
+    def _key(self):
+        return super()._key() + (self.side1, self.side2, self.angle)
+
 
 @dataclass(frozen=True, eq=False)
 class Text(Primitive):
@@ -200,21 +501,19 @@ class Text(Primitive):
     text: str
     font_name: str
     text_size: float
+    native: bool
 
-    def __init__(self, text: str, font_name: str, text_size: float, color: Color):
+    # pylint: disable-next=too-many-arguments
+    def __init__(self, text: str, font_name: str, text_size: float, color: Color,
+                 native: bool = False):
         object.__setattr__(self, "text", text)
         object.__setattr__(self, "font_name", font_name)
         object.__setattr__(self, "text_size", text_size)
-        font = Font(Typeface(font_name), text_size)
-        glyphs = font.textToGlyphs(text)
-        offsets = font.getXPos(glyphs)
-        text_path = Path()
-        for glyph, x_offset in zip(glyphs, offsets):
-            path = font.getPath(glyph)
-            # Some glyphs (e.g., the space) have no outline
-            if path is not None:
-                path.offset(x_offset, 0)
-                text_path.addPath(path)
+        object.__setattr__(self, "native", native)
+        # Paths are never modified once created: texts with the same
+        # content, font and size share the same one.
+        text_path = _text_paths.get((text, font_name, text_size),
+                                    lambda: _text_path(text, font_name, text_size))
 
         # The pinning position is at baseline level (0) on the very left (which
         # might be slightly after 0, given that the bounding box is computed
@@ -223,6 +522,95 @@ class Text(Primitive):
         bounds = text_path.computeTightBounds()
         super().__init__(text_path, color, Point(bounds.left(), 0))
 
+    @property
+    def blob(self) -> Optional[TextBlob]:
+        """
+        The shaped glyphs of this text, to draw it natively.
+
+        :returns: the text blob (None when the text has no glyphs)
+        """
+        if not self.text:
+            return None
+        key = (self.text, self.font_name, self.text_size)
+        return _text_blobs.get(key, lambda: _text_blob(*key))
+
+    def draw(self, canvas: Canvas):
+        if self.native:
+            blob = self.blob
+            if blob is not None:
+                canvas.drawTextBlob(blob, 0, 0, self.paint)
+        else:
+            super().draw(canvas)
+
+    def _key(self):
+        return super()._key() + (self.text, self.font_name, self.text_size, self.native)
+
+
+def _font(font_name: str, text_size: float) -> Font:
+    """
+    Returns a (cached) font with the given name and size.
+
+    :param font_name: name of the font
+    :param text_size: size of the font
+    :returns: the font
+    """
+    return _fonts.get((font_name, text_size), lambda: Font(
+        _typefaces.get(font_name, lambda: Typeface(font_name)), text_size))
+
+
+def _glyph_path(font: Font, font_name: str, text_size: float, glyph: int) -> Path:
+    """
+    Returns the (cached) outline of a glyph of a font.
+
+    :param font: the font
+    :param font_name: name of the font
+    :param text_size: size of the font
+    :param glyph: the glyph
+    :returns: the outline of the glyph (empty when it has no outline, e.g., a space)
+    """
+    def compute() -> Path:
+        path = font.getPath(glyph)
+        return Path() if path is None else path
+    return _glyph_paths.get((font_name, text_size, glyph), compute)
+
+
+def _text_path(text: str, font_name: str, text_size: float) -> Path:
+    """
+    Computes the outline of a text, merging the outlines of its glyphs.
+
+    :param text: the text
+    :param font_name: name of the font
+    :param text_size: size of the font
+    :returns: the outline of the text
+    """
+    font = _font(font_name, text_size)
+    glyphs = font.textToGlyphs(text)
+    offsets = font.getXPos(glyphs)
+    text_path = Path()
+    for glyph, x_offset in zip(glyphs, offsets):
+        text_path.addPath(_glyph_path(font, font_name, text_size, glyph), x_offset, 0)
+    return text_path
+
+
+def _text_blob(text: str, font_name: str, text_size: float) -> TextBlob:
+    """
+    Shapes a text into a blob, placing its glyphs where they are in the
+    outline of the text, and drawing them as close as possible to how the
+    outline would be filled (without anti-aliasing nor hinting).
+
+    :param text: the text
+    :param font_name: name of the font
+    :param text_size: size of the font
+    :returns: the text blob
+    """
+    font = _font(font_name, text_size)
+    offsets = font.getXPos(font.textToGlyphs(text))
+    blob_font = Font(font.getTypeface(), text_size)
+    blob_font.setSubpixel(True)
+    blob_font.setHinting(FontHinting.kNone)
+    blob_font.setEdging(Font.Edging.kAlias)
+    return TextBlob.MakeFromPosTextH(text, offsets, 0, blob_font)
+
 
 @dataclass(frozen=True, eq=False)
 class Compose(Graphic):
@@ -238,19 +626,23 @@ class Compose(Graphic):
         object.__setattr__(self, "background", background)
         fg_pin = self.foreground.pin_position
         bg_pin = self.background.pin_position
-        pin = Point(bg_pin.x(), bg_pin.y())
-        path = Path(self.background.path)
-        path.addPath(self.foreground.path,
-                     bg_pin.x() - fg_pin.x(), bg_pin.y() - fg_pin.y())
-        super().__init__(pin, path)
+        object.__setattr__(self, "translation",
+                           Matrix.Translate(bg_pin.x() - fg_pin.x(), bg_pin.y() - fg_pin.y()))
+        super().__init__(Point(bg_pin.x(), bg_pin.y()))
 
-    def draw(self, canvas: Canvas):
-        canvas.save()
-        self.background.draw(canvas)
-        canvas.translate(self.background.pin_position.x() - self.foreground.pin_position.x(),
-                         self.background.pin_position.y() - self.foreground.pin_position.y())
-        self.foreground.draw(canvas)
-        canvas.restore()
+    def _compute_bounds(self):
+        translation = self.translation  # type: ignore  # pylint: disable=no-member
+        # pylint: disable=protected-access
+        fg_bounds = _offset_bounds(self.foreground._tight_bounds,
+                                   translation.getTranslateX(), translation.getTranslateY())
+        return _union_bounds(self.background._tight_bounds, fg_bounds)
+
+    def _key(self):
+        return self.foreground, self.background
+
+    def _children(self):
+        # pylint: disable-next=no-member
+        return (self.background, None), (self.foreground, self.translation)  # type: ignore
 
 
 @dataclass(frozen=True, eq=False)
@@ -276,10 +668,16 @@ class Pin(Graphic):
             -1.0: bounds.bottom()
         }
         pin = Point(h_mapping[pinning_point.x], v_mapping[pinning_point.y])
-        super().__init__(pin, graphic.path)
+        super().__init__(pin)
 
-    def draw(self, canvas: Canvas):
-        self.graphic.draw(canvas)
+    def _compute_bounds(self):
+        return self.graphic._tight_bounds  # pylint: disable=protected-access
+
+    def _key(self):
+        return self.graphic, (self.pinning_point.x, self.pinning_point.y)
+
+    def _children(self):
+        return ((self.graphic, None),)
 
 
 @dataclass(frozen=True, eq=False)
@@ -290,21 +688,32 @@ class Rotate(Graphic):
     """
     graphic: Graphic
     angle: float
+    rot_matrix: Matrix = field(init=False, repr=False)
 
     def __init__(self, graphic: Graphic, angle: float):
         object.__setattr__(self, "graphic", graphic)
         object.__setattr__(self, "angle", angle)
         object.__setattr__(self, "rot_matrix", Matrix.RotateDeg(angle, graphic.pin_position))
-        path = Path()
-        # transform() mutates the path provided as the second argument
-        graphic.path.transform(self.rot_matrix, path)  # type: ignore  # pylint: disable=no-member
-        super().__init__(graphic.pin_position, path)
+        super().__init__(graphic.pin_position)
+
+    def _compute_bounds(self):
+        # Rotating bounds is not tight: rotate the primitives instead, and
+        # merge the bounds of their rotated paths.
+        bounds = None
+        # pylint: disable-next=protected-access
+        for leaf, matrix in self.graphic._leaves(self.rot_matrix):
+            if leaf._tight_bounds is not None:  # pylint: disable=protected-access
+                rotated_path = Path()
+                # transform() mutates the path provided as the second argument
+                leaf.path.transform(matrix, rotated_path)
+                bounds = _union_bounds(bounds, _path_bounds(rotated_path))
+        return bounds
 
-    def draw(self, canvas: Canvas):
-        canvas.save()
-        canvas.concat(self.rot_matrix)  # type: ignore  # pylint: disable=no-member
-        self.graphic.draw(canvas)
-        canvas.restore()
+    def _key(self):
+        return self.graphic, self.angle
+
+    def _children(self):
+        return ((self.graphic, self.rot_matrix),)
 
 
 @dataclass(frozen=True, eq=False)
@@ -321,10 +730,17 @@ class SimpleCompose(Graphic):
         composed_graphic = Pin(Compose(Pin(graphic1, point1),
                                        Pin(graphic2, point2)), center)
         object.__setattr__(self, "composed_graphic", composed_graphic)
-        super().__init__(composed_graphic.pin_position, composed_graphic.path)
+        super().__init__(composed_graphic.pin_position)
 
-    def draw(self, canvas: Canvas):
-        self.composed_graphic.draw(canvas)  # type: ignore  # pylint: disable=no-member
+    def _compute_bounds(self):
+        # pylint: disable-next=no-member, protected-access
+        return self.composed_graphic._tight_bounds  # type: ignore
+
+    def _key(self):
+        return (self.composed_graphic,)  # type: ignore  # pylint: disable=no-member
+
+    def _children(self):
+        return ((self.composed_graphic, None),)  # type: ignore  # pylint: disable=no-member
 
 
 @dataclass(frozen=True, eq=False)
@@ -370,3 +786,93 @@ class Overlay(SimpleCompose):
         object.__setattr__(self, "front_graphic", front_graphic)
         object.__setattr__(self, "back_graphic", back_graphic)
         super().__init__(front_graphic, back_graphic, center, center)
+
+
+_G = TypeVar("_G", bound=Graphic)
+
+_interning = False  # pylint: disable=invalid-name
+_interned: "WeakValueDictionary[tuple, Graphic]" = WeakValueDictionary()
+_interning_stats = register_stats("interned")
+
+
+def set_interning(enabled: bool):
+    """
+    Enables or disables the interning of graphics.
+
+    When interning is enabled, creating a graphic identical to one that is
+    still in use (same type, same parameters and same component graphics)
+    returns the existing graphic instead of a new one. Identical graphics
+    therefore share memory and everything computed for them (e.g., their
+    bounds). Interning is disabled by default.
+
+    :param enabled: whether graphics should be interned
+    """
+    global _interning  # pylint: disable=global-statement
+    _interning = enabled
+    if not enabled:
+        _interned.clear()
+
+
+def set_native_text(enabled: bool):
+    """
+    Enables or disables drawing texts natively.
+
+    Texts are drawn by default as the outlines of their glyphs, which are
+    exact but slow to draw and verbose in SVG files. When drawing natively is
+    enabled, texts created from then on are drawn as text instead (as text
+    elements in SVG files), which is faster and more compact. Their bounds
+    (and thus their size and pinning positions) are still computed exactly
+    from the outlines of their glyphs.
+
+    :param enabled: whether new texts should be drawn natively
+    """
+    global _native_text  # pylint: disable=global-statement
+    _native_text = enabled
+
+
+def native_text() -> bool:
+    """
+    Returns whether new texts are drawn natively (see `set_native_text`).
+
+    :returns: whether new texts are drawn natively
+    """
+    return _native_text
+
+
+def _intern_key(argument: Any) -> Any:
+    """
+    Returns a hashable value identifying an argument of a graphic constructor.
+    Graphics are identified by their identity: when interning, equal graphics
+    are the same object, and a graphic in the table keeps its components alive.
+
+    :param argument: argument passed to the constructor of a graphic
+    :returns: a hashable value identifying the argument
+    """
+    if isinstance(argument, Graphic):
+        return id(argument)
+    if isinstance(argument, PyTamaroPoint):
+        return argument.x, argument.y
+    return argument
+
+
+def interned(cls: Type[_G], *args) -> _G:
+    """
+    Creates a graphic of the given type with the given arguments or, when
+    interning is enabled, returns an identical graphic created previously
+    and still in use.
+
+    :param cls: type of the graphic
+    :param args: arguments for the constructor of `cls`
+    :returns: the graphic
+    """
+    if not _interning:
+        return cls(*args)
+    key = (cls,) + tuple(_intern_key(argument) for argument in args)
+    graphic = _interned.get(key)
+    if graphic is None:
+        _interning_stats.misses += 1
+        graphic = cls(*args)
+        _interned[key] = graphic
+    else:
+        _interning_stats.hits += 1
+    return graphic  # type: ignore
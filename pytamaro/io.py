@@ -4,22 +4,32 @@ Functions for output (show or save) of graphics.
 
 import base64
 import io
+import itertools
 import os
-import re
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from math import inf
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import List
+from typing import (Any, BinaryIO, Deque, Iterable, Iterator, List, TextIO,
+                    Tuple, Union)
 
 from PIL import Image as PILImageMod
 from PIL.Image import Image as PILImage
-from skia import Canvas, FILEWStream, Image, Rect, Surface, SVGCanvas, kPNG
+from skia import (Canvas, Data, DynamicMemoryWStream, Image, ImageInfo,
+                  Picture, PictureRecorder, Rect, Surface, SVGCanvas, kPNG,
+                  kRGBA_8888_ColorType, kUnpremul_AlphaType)
 
-from pytamaro.checks import check_graphic, check_type
+from pytamaro.checks import check_graphic, check_range, check_type
 from pytamaro.debug import add_debug_info
+from pytamaro.display_list import draw_graphic
+from pytamaro.gif import GifWriter
 from pytamaro.graphic import Graphic
 from pytamaro.localization import translate
+from pytamaro.surfaces import surface_pool
 from pytamaro.utils import export, is_notebook
 
 
@@ -44,12 +54,32 @@ def _draw_to_canvas(canvas: Canvas, graphic: Graphic):
     """
     bounds = graphic.bounds()
     canvas.translate(-bounds.left(), -bounds.top())
-    # Temporarily set the recursion limit to a high value so that we can
-    # traverse the (potentially deeply nested) tree that represents the graphic.
-    current_recursion_limit = sys.getrecursionlimit()
-    sys.setrecursionlimit(100000)
-    graphic.draw(canvas)
-    sys.setrecursionlimit(current_recursion_limit)
+    draw_graphic(canvas, graphic)
+
+
+def graphic_to_svg_bytes(graphic: Graphic) -> bytes:
+    """
+    Renders a graphic into the content of an SVG file, without writing any
+    file.
+
+    :param graphic: graphic to be rendered
+    :returns: the content of the SVG file (UTF-8 encoded)
+    """
+    stream = DynamicMemoryWStream()
+    canvas = SVGCanvas.Make(Rect.MakeSize(graphic.size()), stream)
+    _draw_to_canvas(canvas, graphic)
+    # The SVG document is completed when the canvas is deleted.
+    del canvas
+    content = stream.detachAsData().bytes()
+    # Manually add shape-rendering="crispEdges" to the root `svg` element.
+    # We also manually add `fill="none"` to ensure that renderers always use
+    # a transparent background.
+    # The `svg` tag may be self-closing.
+    start = content.index(b"<svg")
+    end = content.index(b">", start)
+    if content[end - 1:end] == b"/":
+        end -= 1
+    return content[:end] + b' shape-rendering="crispEdges" fill="none"' + content[end:]
 
 
 # pylint: disable-next=invalid-name
@@ -60,26 +90,24 @@ def _save_as_SVG(filename: str, graphic: Graphic):
     :param filename: name of the file to be created, ending in ".svg"
     :param graphic: graphic to be saved
     """
-    size = graphic.size()
-    stream = FILEWStream(filename)
-    canvas = SVGCanvas.Make(Rect.MakeSize(size), stream)
-    _draw_to_canvas(canvas, graphic)
-    del canvas
-    stream.flush()
-    stream.fsync()
-    # Manually add shape-rendering="crispEdges" to the SVG file.
-    # We don't use the XML parser from the standard library because,
-    # among other aspects, it does not properly maintain the doctype.
-    # We also manually add `fill="none"` to the root `svg` element to ensure
-    # that renderers always use a transparent background.
-    with open(filename, "r", encoding="utf-8") as file:
-        content = file.read()
-    # `svg` tag may be self-closing
-    new_content = re.sub("<svg(.*?)(/?)>",
-                         r'<svg\1 shape-rendering="crispEdges" fill="none"\2>',
-                         content)
-    with open(filename, "w", encoding="utf-8") as file:
-        file.write(new_content)
+    content = graphic_to_svg_bytes(graphic)
+    with open(filename, "wb") as file:
+        file.write(content)
+
+
+@contextmanager
+def _rendered(graphic: Graphic) -> Iterator[Surface]:
+    """
+    Renders a graphic onto a surface taken from the pool of surfaces.
+    The surface goes back to the pool when leaving the context.
+
+    :param graphic: graphic to be rendered
+    :returns: a context manager providing the surface
+    """
+    int_size = graphic.size().toCeil()
+    with surface_pool.surface(int_size.width(), int_size.height()) as surface:
+        _draw_to_canvas(surface.getCanvas(), graphic)
+        yield surface
 
 
 def graphic_to_image(graphic: Graphic) -> Image:
@@ -89,10 +117,10 @@ def graphic_to_image(graphic: Graphic) -> Image:
     :param graphic: graphic to be rendered
     :returns: rendered graphic as a Skia image
     """
-    int_size = graphic.size().toCeil()
-    surface = Surface(int_size.width(), int_size.height())
-    _draw_to_canvas(surface.getCanvas(), graphic)
-    return surface.makeImageSnapshot()
+    with _rendered(graphic) as surface:
+        # The image keeps the pixels: drawing onto the surface again (when
+        # reused) does not affect it.
+        return surface.makeImageSnapshot()
 
 
 def graphic_to_pillow_image(graphic: Graphic) -> PILImage:
@@ -102,10 +130,130 @@ def graphic_to_pillow_image(graphic: Graphic) -> PILImage:
     :param graphic: graphic to be rendered and converted
     :returns: rendered graphic as a Pillow image
     """
-    with io.BytesIO(graphic_to_image(graphic).encodeToData()) as stream:
-        pil_image = PILImageMod.open(stream)
-        pil_image.load()  # Ensure to make a copy of buffer
-        return pil_image
+    with _rendered(graphic) as surface:
+        return _to_pillow_image(surface)
+
+
+def _to_pillow_image(pixels_source: Union[Image, Surface]) -> PILImage:
+    """
+    Converts a Skia image (or the content of a surface) into a Pillow image,
+    copying its pixels (with unpremultiplied alpha, as expected by Pillow)
+    into a buffer that the Pillow image then uses directly.
+
+    :param pixels_source: the Skia image or surface
+    :returns: the Pillow image
+    """
+    width, height = pixels_source.width(), pixels_source.height()
+    pixels = bytearray(width * height * 4)
+    pixels_source.readPixels(ImageInfo.Make(width, height, kRGBA_8888_ColorType,
+                                            kUnpremul_AlphaType),
+                             pixels, width * 4)
+    return PILImageMod.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+
+
+def graphic_to_array(graphic: Graphic, dtype: Any = "uint8") -> Any:
+    """
+    Renders a graphic into a NumPy array of shape (height, width, 4), with the
+    red, green, blue and alpha (unpremultiplied) components of each pixel.
+    Pixels are read from the rendered image directly into the array.
+
+    Requires NumPy, which is not a dependency of PyTamaro and must be
+    installed separately.
+
+    :param graphic: graphic to be rendered
+    :param dtype: type of the elements of the array. Components range from 0
+           to 255 for integer types, and from 0 to 1 for floating-point types
+    :returns: rendered graphic as a NumPy array
+    """
+    return graphics_to_array([graphic], dtype)[0]
+
+
+def graphics_to_array(graphics: Iterable[Graphic], dtype: Any = "uint8") -> Any:
+    """
+    Renders many graphics into a single NumPy array of shape (number of
+    graphics, height, width, 4), where the height and width are the largest
+    ones among the graphics. Each graphic is placed in the top-left corner of
+    its slice of the array, surrounded by transparent pixels when smaller.
+    Components are as in `graphic_to_array`.
+
+    :param graphics: graphics to be rendered
+    :param dtype: type of the elements of the array
+    :returns: rendered graphics as a NumPy array
+    """
+    # pylint: disable-next=import-outside-toplevel, import-error
+    import numpy as np  # type: ignore[import]
+    graphics = list(graphics)
+    sizes = [graphic.size().toCeil() for graphic in graphics]
+    height = max((size.height() for size in sizes), default=0)
+    width = max((size.width() for size in sizes), default=0)
+    pixels = np.zeros((len(graphics), height, width, 4), dtype=np.uint8)
+    for index, (graphic, size) in enumerate(zip(graphics, sizes)):
+        if size.width() > 0 and size.height() > 0:
+            info = ImageInfo.Make(size.width(), size.height(),
+                                  kRGBA_8888_ColorType, kUnpremul_AlphaType)
+            with _rendered(graphic) as surface:
+                surface.readPixels(info, pixels[index], width * 4)
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f":
+        return np.divide(pixels, 255, dtype=dtype)
+    return pixels.astype(dtype, copy=False)
+
+
+def _serialize_graphic(graphic: Graphic) -> Tuple[bytes, float, float, int, int]:
+    """
+    Serializes everything needed to render a graphic in another process: its
+    recorded picture, the top-left corner of its bounds and its (integer) size.
+
+    :param graphic: graphic to be serialized
+    :returns: a tuple (picture data, left, top, width, height)
+    """
+    bounds = graphic.bounds()
+    int_size = graphic.size().toCeil()
+    # Not kept in the graphic: frames of an animation are usually drawn once.
+    recorder = PictureRecorder()
+    graphic.draw(recorder.beginRecording(bounds))
+    data = bytes(recorder.finishRecordingAsPicture().serialize())
+    return data, bounds.left(), bounds.top(), int_size.width(), int_size.height()
+
+
+def _render_serialized_graphic(data: bytes, left: float, top: float,
+                               width: int, height: int) -> PILImage:
+    """
+    Renders a graphic serialized by `_serialize_graphic` into a Pillow image
+    (in the same way as `graphic_to_pillow_image`).
+    """
+    with surface_pool.surface(width, height) as surface:
+        canvas = surface.getCanvas()
+        canvas.translate(-left, -top)
+        canvas.drawPicture(Picture.MakeFromData(Data.MakeWithCopy(data)))
+        return _to_pillow_image(surface)
+
+
+def _render_frames(graphics: Iterable[Graphic], workers: int) -> Iterator[PILImage]:
+    """
+    Renders graphics into Pillow images, in order.
+
+    With more than one worker, graphics are compiled in this process and
+    rasterized by a pool of worker processes, each receiving the serialized
+    picture of a graphic. At most two graphics per worker are in flight at any
+    time, which bounds the memory used by frames rendered ahead of time.
+
+    :param graphics: graphics to be rendered
+    :param workers: number of processes rasterizing the graphics
+    :returns: an iterator over the rendered graphics
+    """
+    if workers <= 1:
+        yield from map(graphic_to_pillow_image, graphics)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = deque()
+        for graphic in graphics:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(executor.submit(_render_serialized_graphic,
+                                           *_serialize_graphic(graphic)))
+        while pending:
+            yield pending.popleft().result()
 
 
 # pylint: disable-next=invalid-name
@@ -119,18 +267,122 @@ def _save_as_PNG(filename: str, graphic: Graphic):
     graphic_to_image(graphic).save(filename, kPNG)
 
 
-def _print_data_uri(mime_type: str, b64_content: str):
+def encode_graphic(graphic: Graphic, file_format: str = "png") -> bytes:
+    """
+    Encodes a graphic in a file format, without writing any file.
+    Two file formats are supported: "png" (raster graphics) and "svg"
+    (vector graphics). Graphics with no area cannot be encoded as PNG.
+
+    :param graphic: graphic to be encoded
+    :param file_format: either "png" or "svg"
+    :returns: the content of the file
+    """
+    check_graphic(graphic)
+    if file_format == "png":
+        if graphic.empty_area():
+            size = graphic.bounds().round()
+            raise ValueError(translate("EMPTY_AREA_OUTPUT", f"{size.width()}x{size.height()}"))
+        buffer = io.BytesIO()
+        _write_PNG(buffer, graphic)
+        return buffer.getvalue()
+    if file_format == "svg":
+        return graphic_to_svg_bytes(graphic)
+    raise ValueError(translate("INVALID_FORMAT"))
+
+
+# pylint: disable-next=invalid-name
+def _write_PNG(file: BinaryIO, graphic: Graphic):
+    """
+    Writes a graphic (with some area) in the PNG format to a binary file.
+
+    :param file: binary file to write to
+    :param graphic: graphic to be written
+    """
+    graphic_to_pillow_image(graphic).save(file, format="PNG")
+
+
+def encode_animation(graphics: Iterable[Graphic], duration: int = 40, loop: bool = True,
+                     workers: int = 1) -> bytes:
+    """
+    Encodes a sequence of graphics as an animation (GIF), without writing any
+    file. Parameters are as in `write_animation`.
+
+    :param graphics: graphics to be encoded as an animation
+    :param duration: duration in milliseconds for each frame
+    :param loop: whether the GIF should loop indefinitely
+    :param workers: number of processes rendering the graphics in parallel
+    :returns: the content of the GIF file
+    """
+    frames = _render_animation_frames(graphics, workers)
+    buffer = io.BytesIO()
+    _write_frames(buffer, frames, duration, loop)
+    return buffer.getvalue()
+
+
+class _Base64Writer:
+    """
+    Binary file-like object that base64-encodes the data written to it,
+    writing the encoded text to a text stream as soon as possible (i.e.,
+    whenever full groups of three bytes are available).
+    """
+
+    def __init__(self, output: TextIO):
+        self._output = output
+        self._pending = b""
+
+    def write(self, data: bytes) -> int:
+        """
+        Encodes data and writes it to the text stream (except for up to two
+        trailing bytes, which are kept until more data is written).
+
+        :param data: the data to be written
+        :returns: the number of bytes written
+        """
+        size = len(data)
+        if self._pending:
+            data = self._pending + bytes(data)
+        end = len(data) - len(data) % 3
+        self._pending = bytes(data[end:])
+        if end > 0:
+            self._output.write(base64.b64encode(memoryview(data)[:end]).decode("ascii"))
+        return size
+
+    def flush(self):
+        """
+        Flushes the text stream.
+        """
+        self._output.flush()
+
+    def close(self):
+        """
+        Encodes and writes the last (up to two) bytes, with padding.
+        """
+        self._output.write(base64.b64encode(self._pending).decode("ascii"))
+        self._pending = b""
+
+
+@contextmanager
+def _data_uri_output(mime_type: str) -> Iterator[BinaryIO]:
     """
     Prints a data URI to standard output with a special prefix and suffix so
     that it can be recognized in the context of a larger output.
+    The content of the data URI is written (and printed, base64-encoded, as it
+    is written) to the binary file-like object provided by this context
+    manager, so that the output can be consumed while it is being produced.
 
     :param mime_type: MIME type of the data (e.g., "image/png")
-    :param b64_content: base64-encoded content
+    :returns: a context manager providing a binary file-like object for the content
     """
     prefix = "@@@PYTAMARO_DATA_URI_BEGIN@@@"
     suffix = "@@@PYTAMARO_DATA_URI_END@@@"
-    uri = f"data:{mime_type};base64,{b64_content}"
-    print(f"{prefix}{uri}{suffix}", end="")
+    sys.stdout.write(f"{prefix}data:{mime_type};base64,")
+    writer = _Base64Writer(sys.stdout)
+    # When writing the content fails, the exception propagates without
+    # printing the suffix: a data URI is only terminated when complete.
+    yield writer  # type: ignore
+    writer.close()
+    sys.stdout.write(suffix)
+    sys.stdout.flush()
 
 
 @export
@@ -151,17 +403,14 @@ def show_graphic(graphic: Graphic, debug: bool = False):
         _warning_no_area(graphic)
     else:
         to_show = add_debug_info(graphic) if debug else graphic
-        pil_image = graphic_to_pillow_image(to_show)
         if is_notebook():
             # pylint: disable-next=undefined-variable
-            display(pil_image)  # type: ignore[name-defined]
+            display(graphic_to_pillow_image(to_show))  # type: ignore[name-defined]
         elif "PYTAMARO_OUTPUT_DATA_URI" in os.environ:
-            buffer = io.BytesIO()
-            pil_image.save(buffer, format="PNG")
-            b64_str = base64.b64encode(buffer.getvalue()).decode("utf-8")
-            _print_data_uri("image/png", b64_str)
+            with _data_uri_output("image/png") as output:
+                _write_PNG(output, to_show)
         else:
-            pil_image.show()
+            graphic_to_pillow_image(to_show).show()
 
 
 @export
@@ -198,7 +447,8 @@ def save_graphic(filename: str, graphic: Graphic, debug: bool = False):
 
 
 @export
-def save_animation(filename: str, graphics: List[Graphic], duration: int = 40, loop: bool = True):
+def save_animation(filename: str, graphics: List[Graphic], duration: int = 40, loop: bool = True,
+                   workers: int = 1):
     """
     Save a sequence of graphics as an animation (GIF).
 
@@ -210,21 +460,83 @@ def save_animation(filename: str, graphics: List[Graphic], duration: int = 40, l
     :param duration: duration in milliseconds for each frame
            (defaults to 40 milliseconds, which leads to 25 frames per second)
     :param loop: whether the GIF should loop indefinitely (defaults to true)
+    :param workers: number of processes rendering the graphics in parallel
+           (defaults to 1, which renders them in the current process)
     """
     check_type(filename, str, "filename")
     if Path(filename).suffix != ".gif":
         raise ValueError(translate("INVALID_FILENAME_GIF"))
+    _check_graphics_list(graphics)
+    write_animation(filename, graphics, duration, loop, workers)
+
+
+def _check_graphics_list(graphics: List[Graphic]):
+    """
+    Raises an exception when the provided value is not valid for the graphics
+    of an animation, not being a non-empty list.
+
+    :param graphics: the value to be checked
+    """
     check_type(graphics, list, "graphics")
     if len(graphics) == 0:
         raise ValueError(translate("EMPTY_GRAPHICS_LIST"))
-    pil_images = list(map(graphic_to_pillow_image, graphics))
-    pil_images[0].save(
-        filename,
-        save_all=True,
-        append_images=pil_images[1:],
-        duration=duration,
-        loop=0 if loop else 1,  # loop 0 means "indefinitely", 1 means "once"
-    )
+
+
+def write_animation(filename: str, graphics: Iterable[Graphic], duration: int = 40,
+                    loop: bool = True, workers: int = 1):
+    """
+    Save a sequence of graphics as an animation (GIF), like `save_animation`,
+    writing each frame to the file as soon as it is rendered.
+
+    Graphics can be provided by any iterable (e.g., a generator producing
+    them lazily): only a few of them, and of the rendered frames, are held in
+    memory at any time, regardless of the length of the animation.
+
+    :param filename: name of the file to create, including the extension '.gif'
+    :param graphics: graphics to be saved as an animation
+    :param duration: duration in milliseconds for each frame
+           (defaults to 40 milliseconds, which leads to 25 frames per second)
+    :param loop: whether the GIF should loop indefinitely (defaults to true)
+    :param workers: number of processes rendering the graphics in parallel
+           (defaults to 1, which renders them in the current process)
+    """
+    frames = _render_animation_frames(graphics, workers)
+    with open(filename, "wb") as file:
+        _write_frames(file, frames, duration, loop)
+
+
+def _render_animation_frames(graphics: Iterable[Graphic], workers: int) -> Iterator[PILImage]:
+    """
+    Renders the graphics of an animation, like `_render_frames`, raising an
+    exception (before returning) when there is no graphic.
+
+    :param graphics: graphics to be rendered
+    :param workers: number of processes rendering the graphics
+    :returns: an iterator over the rendered graphics
+    """
+    check_type(workers, int, "workers")
+    check_range(workers, 1, inf, "workers")
+    frames = _render_frames(graphics, workers)
+    first_frame = next(frames, None)
+    if first_frame is None:
+        raise ValueError(translate("EMPTY_GRAPHICS_LIST"))
+    return itertools.chain([first_frame], frames)
+
+
+def _write_frames(file: BinaryIO, frames: Iterable[PILImage], duration: int, loop: bool):
+    """
+    Writes rendered frames as an animation (GIF) to a binary file.
+
+    :param file: binary file to write to
+    :param frames: the rendered frames
+    :param duration: duration in milliseconds for each frame
+    :param loop: whether the GIF should loop indefinitely
+    """
+    # loop 0 means "indefinitely", 1 means "once"
+    writer = GifWriter(file, duration, 0 if loop else 1)
+    for frame in frames:
+        writer.write(frame)
+    writer.close()
 
 
 @export
@@ -240,21 +552,23 @@ def show_animation(graphics: List[Graphic], duration: int = 40, loop: bool = Tru
            (defaults to 40 milliseconds, which leads to 25 frames per second)
     :param loop: whether the animation should loop indefinitely (defaults to true)
     """
-    with NamedTemporaryFile(suffix=".gif", delete=False) as file:
-        save_animation(file.name, graphics, duration, loop)
-        if is_notebook():
-            # pylint: disable-next=import-outside-toplevel, import-error
-            from IPython.display import Image as IPythonImage  # type: ignore[import]
-            with open(file.name, "rb") as stream:
-                # pylint: disable-next=undefined-variable
-                display(IPythonImage(stream.read()))  # type: ignore[name-defined]
-        elif "PYTAMARO_OUTPUT_DATA_URI" in os.environ:
-            with open(file.name, "rb") as stream:
-                b64_str = base64.b64encode(stream.read()).decode("utf-8")
-                _print_data_uri("image/gif", b64_str)
-        elif sys.platform == "win32":
-            os.startfile(file.name)
-        elif sys.platform == "darwin":
-            subprocess.call(["open", "-a", "Safari", file.name])
-        else:
-            subprocess.call(["xdg-open", file.name])
+    _check_graphics_list(graphics)
+    if is_notebook():
+        # pylint: disable-next=import-outside-toplevel, import-error
+        from IPython.display import Image as IPythonImage  # type: ignore[import]
+        data = encode_animation(graphics, duration, loop)
+        # pylint: disable-next=undefined-variable
+        display(IPythonImage(data))  # type: ignore[name-defined]
+    elif "PYTAMARO_OUTPUT_DATA_URI" in os.environ:
+        frames = _render_animation_frames(graphics, 1)
+        with _data_uri_output("image/gif") as output:
+            _write_frames(output, frames, duration, loop)
+    else:
+        with NamedTemporaryFile(suffix=".gif", delete=False) as file:
+            save_animation(file.name, graphics, duration, loop)
+            if sys.platform == "win32":
+                os.startfile(file.name)
+            elif sys.platform == "darwin":
+                subprocess.call(["open", "-a", "Safari", file.name])
+            else:
+                subprocess.call(["xdg-open", file.name])
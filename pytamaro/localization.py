@@ -25,6 +25,11 @@ translations = {
         "it": "Estensione non valida o mancante per il nome del file: sono supportati solo .png e .svg",
         "de": "Ungültige oder fehlende Dateinamenerweiterung: Nur .png und .svg werden unterstützt",
     },
+    "INVALID_FORMAT": {
+        "en": "Invalid format: only png and svg are supported",
+        "it": "Formato non valido: sono supportati solo png e svg",
+        "de": "Ungültiges Format: Nur png und svg werden unterstützt",
+    },
     "INVALID_FILENAME_GIF": {
         "en": "Invalid or missing extension for a GIF file: needs to end with `.gif`",
         "it": "Estensione non valida o mancante per un file GIF: deve terminare con `.gif`",
@@ -40,6 +45,11 @@ translations = {
         "it": "Impossibile mostrare/salvare una grafica di dimensione {} poiché non ha area",
         "de": "Kann eine Grafik der Größe {} nicht anzeigen/speichern, da sie keine Fläche hat",
     },
+    "BUFFER_TOO_SMALL": {
+        "en": "The buffer is too small for a graphic of size {}: {} bytes are needed, got {}",
+        "it": "Il buffer è troppo piccolo per una grafica di dimensione {}: servono {} byte, ottenuti {}",
+        "de": "Der Puffer ist zu klein für eine Grafik der Größe {}: {} Bytes werden benötigt, erhalten {}",
+    },
     # Parameter names
     "width": {
         "en": "width",
@@ -2,7 +2,7 @@
 Functions to do operations on graphics (mainly, to combine them).
 """
 
-from pytamaro.graphic import Compose, Graphic, Pin, Rotate, Beside, Above, Overlay
+from pytamaro.graphic import Compose, Graphic, Pin, Rotate, Beside, Above, Overlay, interned
 from pytamaro.checks import check_angle, check_graphic, check_point
 from pytamaro.utils import export
 from pytamaro.point import Point
@@ -49,7 +49,7 @@ def compose(foreground_graphic: Graphic, background_graphic: Graphic) -> Graphic
     """
     check_graphic(foreground_graphic, "foreground_graphic")
     check_graphic(background_graphic, "background_graphic")
-    return Compose(foreground_graphic, background_graphic)
+    return interned(Compose, foreground_graphic, background_graphic)
 
 
 @export
@@ -71,7 +71,7 @@ def pin(point: Point, graphic: Graphic) -> Graphic:
     """
     check_point(point)
     check_graphic(graphic)
-    return Pin(graphic, point)
+    return interned(Pin, graphic, point)
 
 
 @export
@@ -89,7 +89,7 @@ def overlay(foreground_graphic: Graphic, background_graphic: Graphic) -> Graphic
     """
     check_graphic(foreground_graphic, "foreground_graphic")
     check_graphic(background_graphic, "background_graphic")
-    return Overlay(foreground_graphic, background_graphic)
+    return interned(Overlay, foreground_graphic, background_graphic)
 
 
 @export
@@ -107,7 +107,7 @@ def beside(left_graphic: Graphic, right_graphic: Graphic) -> Graphic:
     """
     check_graphic(left_graphic, "left_graphic")
     check_graphic(right_graphic, "right_graphic")
-    return Beside(left_graphic, right_graphic)
+    return interned(Beside, left_graphic, right_graphic)
 
 
 @export
@@ -125,7 +125,7 @@ def above(top_graphic: Graphic, bottom_graphic: Graphic) -> Graphic:
     """
     check_graphic(top_graphic, "top_graphic")
     check_graphic(bottom_graphic, "bottom_graphic")
-    return Above(top_graphic, bottom_graphic)
+    return interned(Above, top_graphic, bottom_graphic)
 
 
 @export
@@ -142,4 +142,4 @@ def rotate(angle: float, graphic: Graphic) -> Graphic:
     check_angle(angle)
     check_graphic(graphic)
     # Negate the angle given that Rotate is clockwise.
-    return Rotate(graphic, -angle)
+    return interned(Rotate, graphic, -angle)
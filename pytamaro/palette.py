@@ -0,0 +1,191 @@
+"""
+Palettes: many colors stored in a single array, created from arrays of
+components with one vectorized computation instead of one function call per
+color.
+
+This module requires NumPy, which is not a dependency of PyTamaro and must be
+installed separately.
+"""
+
+from typing import Any, Iterator, Tuple, Union, overload
+
+import numpy as np
+
+from pytamaro.color import Color
+from pytamaro.localization import translate
+
+
+class Palette:
+    """
+    Represents a sequence of colors, stored compactly in an array of 32-bit
+    integers with 8 bits for each component: alpha, red, green, blue.
+    Indexing a palette with an integer returns a color, while indexing it with
+    a slice (or an array of indices) returns another palette.
+    """
+
+    def __init__(self, argb: Any):
+        self.argb: np.ndarray = np.asarray(argb, dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.argb)
+
+    @overload
+    def __getitem__(self, index: int) -> Color:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "Palette":
+        ...
+
+    @overload
+    def __getitem__(self, index: Any) -> Union[Color, "Palette"]:
+        ...
+
+    def __getitem__(self, index: Any) -> Union[Color, "Palette"]:
+        argb = self.argb[index]
+        if np.ndim(argb) == 0:
+            return Color.from_argb(int(argb))
+        return Palette(argb)
+
+    def __iter__(self) -> Iterator[Color]:
+        return (Color.from_argb(argb) for argb in self.argb.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Palette):
+            return np.array_equal(self.argb, other.argb)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Palette({len(self)} colors)"
+
+
+def _check_range(values: Any, lower_bound: float, upper_bound: float,
+                 parameter_name: str) -> np.ndarray:
+    """
+    Converts the provided values to an array of numbers, raising an exception
+    when any of them is not valid for a range, being outside the specified
+    range or not a numeric type.
+
+    :param values: the values to be checked (an array, a buffer, a sequence or a number)
+    :param lower_bound: the lower bound of the range
+    :param upper_bound: the upper bound of the range
+    :param parameter_name: original parameter name, to be used in the error message
+    :returns: the values as an array of floating-point numbers
+    """
+    array = np.asarray(values)
+    if array.dtype.kind not in "biuf":
+        raise TypeError(translate("INVALID_TYPE",
+                                  translate(parameter_name),
+                                  translate("Number"),
+                                  translate(str(array.dtype))))
+    array = array.astype(np.float64, copy=False)
+    # Also rejects NaN, for which both comparisons are false.
+    if not np.all((array >= lower_bound) & (array <= upper_bound)):
+        raise ValueError(translate("INVALID_RANGE",
+                                   translate(parameter_name),
+                                   lower_bound,
+                                   upper_bound))
+    return array
+
+
+def _pack(red: np.ndarray, green: np.ndarray, blue: np.ndarray,
+          opacity: np.ndarray) -> Palette:
+    """
+    Packs arrays of (already validated) components into a palette, rounding
+    them like `Color` does.
+    """
+    red, green, blue, opacity = np.broadcast_arrays(red, green, blue, opacity)
+
+    def to_byte(component: np.ndarray) -> np.ndarray:
+        return np.floor(component + 0.5).astype(np.uint32)
+
+    argb = (to_byte(opacity * 255) << 24 | to_byte(red) << 16 |
+            to_byte(green) << 8 | to_byte(blue))
+    return Palette(np.atleast_1d(argb))
+
+
+def _hue_to_rgb(hue: np.ndarray, chroma: np.ndarray,
+                to_add: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the red, green and blue components [0-255] for arrays of hues,
+    chromas and lightness offsets, in the same way as `hsv_color` and
+    `hsl_color` do for a single color.
+    """
+    side = (hue / 60) % 6
+    x_value = chroma * (1 - np.abs(side % 2 - 1))
+    zero = np.zeros_like(x_value)
+    # Index of the side of the hexagon of hues, from 0 (red to yellow)
+    # to 5 (magenta to red).
+    sector = np.minimum(side.astype(np.intp), 5)
+    red = np.choose(sector, (chroma, x_value, zero, zero, x_value, chroma))
+    green = np.choose(sector, (x_value, chroma, chroma, x_value, zero, zero))
+    blue = np.choose(sector, (zero, zero, x_value, chroma, chroma, x_value))
+    return tuple(np.trunc((component + to_add) * 255)  # type: ignore
+                 for component in (red, green, blue))
+
+
+def rgb_palette(red: Any, green: Any, blue: Any, opacity: Any = 1.0) -> Palette:
+    """
+    Returns a palette of colors with the provided components for red (R),
+    green (G) and blue (B) and a certain degree of opacity (alpha, A).
+    Each component can be an array (or any sequence or buffer) with one
+    value per color, or a single value shared by all the colors.
+
+    :param red: red components [0-255]
+    :param green: green components [0-255]
+    :param blue: blue components [0-255]
+    :param opacity: opacities (alpha) of the colors, where 0 means fully
+           transparent and 1 fully opaque. By default, all colors are fully opaque.
+    :returns: a palette with the colors with the provided RGBA components
+    """
+    return _pack(_check_range(red, 0, 255, "red"),
+                 _check_range(green, 0, 255, "green"),
+                 _check_range(blue, 0, 255, "blue"),
+                 _check_range(opacity, 0, 1, "opacity"))
+
+
+def hsv_palette(hue: Any, saturation: Any, value: Any, opacity: Any = 1.0) -> Palette:
+    """
+    Returns a palette of colors with the provided hue (H), saturation (S),
+    value (V) and a certain degree of opacity (alpha, A).
+    Each component can be an array (or any sequence or buffer) with one
+    value per color, or a single value shared by all the colors.
+
+    :param hue: hues of the colors [0-360]
+    :param saturation: saturations of the colors [0-1]
+    :param value: the amounts of light that are applied [0-1]
+    :param opacity: opacities (alpha) of the colors, where 0 means fully
+           transparent and 1 fully opaque. By default, all colors are fully opaque.
+    :returns: a palette with the colors with the provided HSVA components
+    """
+    hue = _check_range(hue, 0, 360, "hue")
+    saturation = _check_range(saturation, 0, 1, "saturation")
+    value = _check_range(value, 0, 1, "value")
+    opacity = _check_range(opacity, 0, 1, "opacity")
+    hue, saturation, value = np.broadcast_arrays(hue, saturation, value)
+    chroma = value * saturation
+    return _pack(*_hue_to_rgb(hue, chroma, value - chroma), opacity)
+
+
+def hsl_palette(hue: Any, saturation: Any, lightness: Any, opacity: Any = 1.0) -> Palette:
+    """
+    Returns a palette of colors with the provided hue (H), saturation (S),
+    lightness (L) and a certain degree of opacity (alpha, A).
+    Each component can be an array (or any sequence or buffer) with one
+    value per color, or a single value shared by all the colors.
+
+    :param hue: hues of the colors [0-360]
+    :param saturation: saturations of the colors [0-1]
+    :param lightness: the amounts of white or black applied [0-1].
+            Fully saturated colors have a lightness value of 1/2.
+    :param opacity: opacities (alpha) of the colors, where 0 means fully
+           transparent and 1 fully opaque. By default, all colors are fully opaque.
+    :returns: a palette with the colors with the provided HSLA components
+    """
+    hue = _check_range(hue, 0, 360, "hue")
+    saturation = _check_range(saturation, 0, 1, "saturation")
+    lightness = _check_range(lightness, 0, 1, "lightness")
+    opacity = _check_range(opacity, 0, 1, "opacity")
+    hue, saturation, lightness = np.broadcast_arrays(hue, saturation, lightness)
+    chroma = (1 - np.abs(2 * lightness - 1)) * saturation
+    return _pack(*_hue_to_rgb(hue, chroma, lightness - chroma / 2), opacity)
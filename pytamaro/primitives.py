@@ -6,7 +6,8 @@ graphic's bounding box.
 
 from pytamaro.color import Color
 from pytamaro.graphic import (CircularSector, Ellipse, Empty, Graphic,
-                              Rectangle, Text, Triangle)
+                              Rectangle, Text, Triangle, interned,
+                              native_text)
 from pytamaro.checks import check_angle, check_color, check_length, check_number, check_type
 from pytamaro.utils import export
 
@@ -24,7 +25,7 @@ def rectangle(width: float, height: float, color: Color) -> Graphic:
     check_length(width, "width")
     check_length(height, "height")
     check_color(color)
-    return Rectangle(width, height, color)
+    return interned(Rectangle, width, height, color)
 
 
 @export
@@ -36,7 +37,7 @@ def empty_graphic() -> Graphic:
 
     :returns: an empty graphic (width and height 0)
     """
-    return Empty()
+    return interned(Empty)
 
 
 @export
@@ -55,7 +56,7 @@ def ellipse(width: float, height: float, color: Color) -> Graphic:
     check_length(width, "width")
     check_length(height, "height")
     check_color(color)
-    return Ellipse(width, height, color)
+    return interned(Ellipse, width, height, color)
 
 
 @export
@@ -84,7 +85,7 @@ def circular_sector(radius: float, angle: float, color: Color) \
     check_length(radius, "radius")
     check_angle(angle, 0, 360)
     check_color(color)
-    return CircularSector(radius, angle, color)
+    return interned(CircularSector, radius, angle, color)
 
 
 @export
@@ -110,7 +111,7 @@ def triangle(side1: float, side2: float, angle: float, color: Color) -> Graphic:
     check_length(side1, "side1")
     check_length(side2, "side2")
     check_angle(angle, 0, 180)
-    return Triangle(side1, side2, angle, color)
+    return interned(Triangle, side1, side2, angle, color)
 
 
 @export
@@ -138,4 +139,4 @@ def text(content: str, font: str, points: float, color: Color) \
     check_type(font, str, "font")
     check_number(points, "points")
     check_color(color)
-    return Text(content, font, points, color)
+    return interned(Text, content, font, points, color, native_text())
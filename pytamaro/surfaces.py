@@ -0,0 +1,121 @@
+"""
+Pool of raster surfaces, reused across renders of graphics of the same size
+instead of allocating new pixel buffers each time.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Hashable, Iterator, List, Optional
+
+from skia import AlphaType, ColorTRANSPARENT, ColorType, ImageInfo, Surface
+
+from pytamaro.cache import register_stats
+
+
+class SurfacePool:
+    """
+    Raster surfaces not in use, indexed by their width, height and color type.
+    When the surfaces held take more than `capacity` bytes, the least recently
+    used ones are released.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.stats = register_stats("surfaces")
+        self._surfaces: "OrderedDict[Hashable, List[Surface]]" = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return sum(len(surfaces) for surfaces in self._surfaces.values())
+
+    @property
+    def size(self) -> int:
+        """
+        Number of bytes taken by the pixels of the surfaces held.
+        """
+        return self._size
+
+    @contextmanager
+    def surface(self, width: int, height: int,
+                color_type: Optional[ColorType] = None) -> Iterator[Surface]:
+        """
+        Provides a cleared (transparent) surface of the given size and color
+        type, taken from this pool when available, and gives it back to this
+        pool afterwards. The surface must not be used after that.
+
+        :param width: width of the surface
+        :param height: height of the surface
+        :param color_type: color type of the surface (by default, the native
+               32-bit color type, like `Surface(width, height)`)
+        :returns: a context manager providing the surface
+        """
+        key = (width, height, color_type)
+        with self._lock:
+            surfaces = self._surfaces.get(key)
+            surface = surfaces.pop() if surfaces else None
+            if surface is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self._size -= _byte_size(surface)
+                if not surfaces:
+                    del self._surfaces[key]
+        if surface is None:
+            if color_type is None:
+                surface = Surface(width, height)
+            else:
+                surface = Surface.MakeRaster(ImageInfo.Make(width, height, color_type,
+                                                            AlphaType.kPremul_AlphaType))
+        else:
+            surface.getCanvas().clear(ColorTRANSPARENT)
+        canvas = surface.getCanvas()
+        save_count = canvas.save()
+        try:
+            yield surface
+        finally:
+            canvas.restoreToCount(save_count)
+            self._release(key, surface)
+
+    def _release(self, key: Hashable, surface: Surface):
+        size = _byte_size(surface)
+        with self._lock:
+            if size > self.capacity:
+                return
+            self._surfaces.setdefault(key, []).append(surface)
+            self._surfaces.move_to_end(key)
+            self._size += size
+            self._evict()
+
+    def _evict(self):
+        while self._size > self.capacity:
+            key, surfaces = next(iter(self._surfaces.items()))
+            self._size -= _byte_size(surfaces.pop(0))
+            if not surfaces:
+                del self._surfaces[key]
+
+    def set_capacity(self, capacity: int):
+        """
+        Changes the maximum number of bytes taken by the surfaces held,
+        releasing the least recently used surfaces that no longer fit.
+
+        :param capacity: the new capacity, in bytes (0 disables the pool)
+        """
+        with self._lock:
+            self.capacity = capacity
+            self._evict()
+
+
+def _byte_size(surface: Surface) -> int:
+    """
+    Computes the number of bytes taken by the pixels of a surface.
+
+    :param surface: the surface
+    :returns: the number of bytes
+    """
+    return surface.imageInfo().computeMinByteSize()
+
+
+# Surfaces used to render graphics.
+surface_pool = SurfacePool(64 * 1024 * 1024)
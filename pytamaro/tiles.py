@@ -0,0 +1,182 @@
+"""
+Tiled rendering of (very large) graphics, which are rendered one tile at a
+time instead of onto a single surface as large as the graphic.
+
+Only a tile-sized surface is used, and each tile only replays the drawing
+operations whose bounds intersect it (see `DisplayList.draw`). Pixels go
+straight into a buffer provided by the caller (which can be memory-mapped),
+or are encoded into a PNG file one band of tiles at a time. A band spans the
+whole width of the graphic: writing a PNG file takes tile size * width * 4
+bytes, which depends on the width of the graphic but not on its height.
+"""
+
+import struct
+import zlib
+from math import inf
+from typing import Any, BinaryIO
+
+from skia import (Canvas, ColorTRANSPARENT, ImageInfo, IRect, Rect,
+                  kRGBA_8888_ColorType, kUnpremul_AlphaType)
+
+from pytamaro.checks import check_graphic, check_range, check_type
+from pytamaro.display_list import DisplayList, compile_graphic
+from pytamaro.graphic import Graphic
+from pytamaro.localization import translate
+from pytamaro.surfaces import surface_pool
+
+# Number of bytes of each pixel (red, green, blue and alpha).
+_PIXEL_SIZE = 4
+
+
+def _check_tiled_graphic(graphic: Graphic, tile_size: int):
+    """
+    Checks the arguments of the functions of this module, raising an exception
+    when the tiles are not at least one pixel wide or when the graphic has no
+    area (and therefore no pixels).
+
+    :param graphic: graphic to be rendered
+    :param tile_size: width and height of the tiles
+    """
+    check_graphic(graphic)
+    check_type(tile_size, int, "tile_size")
+    check_range(tile_size, 1, inf, "tile_size")
+    if graphic.empty_area():
+        size = graphic.bounds().round()
+        raise ValueError(translate("EMPTY_AREA_OUTPUT", f"{size.width()}x{size.height()}"))
+
+
+def _draw_tile(canvas: Canvas, display_list: DisplayList, bounds: Rect, tile: IRect):
+    """
+    Draws a tile of a graphic onto a (cleared) canvas, with the top-left
+    corner of the tile at the origin.
+
+    :param canvas: canvas onto which to draw
+    :param display_list: the compiled graphic
+    :param bounds: bounds of the graphic
+    :param tile: the tile, relative to the top-left corner of the bounds
+    """
+    canvas.clear(ColorTRANSPARENT)
+    canvas.save()
+    # Operations outside of the tile are culled by the display list.
+    canvas.clipRect(Rect.MakeWH(tile.width(), tile.height()))
+    canvas.translate(-bounds.left() - tile.left(), -bounds.top() - tile.top())
+    display_list.draw(canvas)
+    canvas.restore()
+
+
+def _render_rows(graphic: Graphic, first_row: int, rows: int, pixels: memoryview,
+                 tile_size: int):
+    """
+    Renders some consecutive rows of pixels of a graphic, one tile at a time,
+    writing them in a buffer (with the first row at its start).
+    Pixels are stored with red, green, blue and alpha (unpremultiplied)
+    components, like in `graphic_to_pillow_image`.
+
+    :param graphic: graphic to be rendered
+    :param first_row: index of the first row to be rendered
+    :param rows: number of rows to be rendered
+    :param pixels: buffer to write the pixels in
+    :param tile_size: width and height of the tiles
+    """
+    bounds = graphic.bounds()
+    width = graphic.size().toCeil().width()
+    row_bytes = width * _PIXEL_SIZE
+    display_list = compile_graphic(graphic)
+    with surface_pool.surface(tile_size, tile_size) as surface:
+        for tile_top in range(first_row, first_row + rows, tile_size):
+            tile_height = min(tile_size, first_row + rows - tile_top)
+            for tile_left in range(0, width, tile_size):
+                tile = IRect.MakeXYWH(tile_left, tile_top,
+                                      min(tile_size, width - tile_left), tile_height)
+                _draw_tile(surface.getCanvas(), display_list, bounds, tile)
+                offset = (tile_top - first_row) * row_bytes + tile_left * _PIXEL_SIZE
+                surface.readPixels(ImageInfo.Make(tile.width(), tile.height(),
+                                                  kRGBA_8888_ColorType, kUnpremul_AlphaType),
+                                   pixels[offset:], row_bytes)
+
+
+def graphic_to_buffer(graphic: Graphic, buffer: Any, tile_size: int = 1024):
+    """
+    Renders a graphic, one tile at a time, into a writable buffer (e.g., a
+    `bytearray`, a memory-mapped file or a NumPy array) of at least
+    width * height * 4 bytes. Pixels are stored row by row, with the red,
+    green, blue and alpha (unpremultiplied) components of each pixel.
+
+    :param graphic: graphic to be rendered (with some area)
+    :param buffer: buffer to write the pixels in
+    :param tile_size: width and height of the tiles, in pixels
+    """
+    _check_tiled_graphic(graphic, tile_size)
+    pixels = memoryview(buffer).cast("B")
+    int_size = graphic.size().toCeil()
+    needed = int_size.width() * int_size.height() * _PIXEL_SIZE
+    if len(pixels) < needed:
+        raise ValueError(translate("BUFFER_TOO_SMALL", f"{int_size.width()}x{int_size.height()}",
+                                   needed, len(pixels)))
+    _render_rows(graphic, 0, int_size.height(), pixels, tile_size)
+
+
+def _png_chunk(file: BinaryIO, chunk_type: bytes, data: bytes):
+    """
+    Writes a chunk of a PNG file.
+
+    :param file: binary file to write to
+    :param chunk_type: type of the chunk (four ASCII letters)
+    :param data: content of the chunk
+    """
+    file.write(struct.pack(">I", len(data)))
+    file.write(chunk_type)
+    file.write(data)
+    file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
+
+
+# pylint: disable-next=invalid-name
+def write_tiled_PNG(file: BinaryIO, graphic: Graphic, tile_size: int = 1024):
+    """
+    Renders a graphic, one tile at a time, and writes it in the PNG format
+    (8-bit RGBA) to a binary file. Each band of tiles is compressed and
+    written as soon as it is rendered: only the pixels of one band (tile_size
+    rows of the graphic) are held in memory.
+
+    :param file: binary file to write to
+    :param graphic: graphic to be written (with some area)
+    :param tile_size: width and height of the tiles, in pixels
+    """
+    _check_tiled_graphic(graphic, tile_size)
+    int_size = graphic.size().toCeil()
+    width, height = int_size.width(), int_size.height()
+    row_bytes = width * _PIXEL_SIZE
+    file.write(b"\x89PNG\r\n\x1a\n")
+    # 8 bits per component, RGBA, default compression, filter and interlacing.
+    _png_chunk(file, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+    compressor = zlib.compressobj()
+    band = bytearray(min(tile_size, height) * row_bytes)
+    for first_row in range(0, height, tile_size):
+        rows = min(tile_size, height - first_row)
+        _render_rows(graphic, first_row, rows, memoryview(band), tile_size)
+        data = bytearray()
+        for row in range(rows):
+            # Each row starts with its filter type (none).
+            data.append(0)
+            data += band[row * row_bytes:(row + 1) * row_bytes]
+        compressed = compressor.compress(data)
+        if compressed:
+            _png_chunk(file, b"IDAT", compressed)
+    _png_chunk(file, b"IDAT", compressor.flush())
+    _png_chunk(file, b"IEND", b"")
+    file.flush()
+
+
+def save_tiled_graphic(filename: str, graphic: Graphic, tile_size: int = 1024):
+    """
+    Saves a graphic (with some area) to a PNG file, rendering it one tile at a
+    time: unlike `save_graphic`, graphics much larger than the memory
+    available (or than the largest surface that can be allocated) can be
+    saved.
+
+    :param filename: name of the file to be created
+    :param graphic: graphic to be saved
+    :param tile_size: width and height of the tiles, in pixels
+    """
+    with open(filename, "wb") as file:
+        write_tiled_PNG(file, graphic, tile_size)
@@ -0,0 +1,39 @@
+from pytest import importorskip
+
+from pytamaro.color_functions import rgb_color
+from pytamaro.color_names import blue, red
+from pytamaro.io import graphic_to_array, graphic_to_pillow_image, graphics_to_array
+from pytamaro.operations import beside
+from pytamaro.primitives import ellipse, empty_graphic, rectangle
+
+from tests.testing_utils import HEIGHT, WIDTH
+
+np = importorskip("numpy")
+
+
+def test_graphic_to_array():
+    g = beside(rectangle(WIDTH, HEIGHT, rgb_color(255, 0, 0, 0.5)), ellipse(WIDTH, HEIGHT, blue))
+    pixels = graphic_to_array(g)
+    assert pixels.shape == (HEIGHT, 2 * WIDTH, 4)
+    assert pixels.dtype == np.uint8
+    assert (pixels == np.asarray(graphic_to_pillow_image(g))).all()
+    assert pixels[0, 0].tolist() == [255, 0, 0, 128]
+
+
+def test_graphic_to_float_array():
+    pixels = graphic_to_array(rectangle(WIDTH, HEIGHT, red), "float32")
+    assert pixels.dtype == np.float32
+    assert (pixels == np.array([1, 0, 0, 1], dtype=np.float32)).all()
+
+
+def test_empty_graphic_to_array():
+    assert graphic_to_array(empty_graphic()).shape == (0, 0, 4)
+
+
+def test_graphics_to_array():
+    small = rectangle(WIDTH // 2, HEIGHT, red)
+    pixels = graphics_to_array([rectangle(WIDTH, HEIGHT // 2, blue), small, empty_graphic()])
+    assert pixels.shape == (3, HEIGHT, WIDTH, 4)
+    assert (pixels[1, :, :WIDTH // 2] == graphic_to_array(small)).all()
+    assert not pixels[1, :, WIDTH // 2:].any()
+    assert not pixels[2].any()
@@ -0,0 +1,87 @@
+from pytest import fixture
+from skia import Rect, Size
+
+from pytamaro.cache import (LRUCache, _caches, _stats, cache_stats,
+                            reset_cache_stats, set_cache_capacity)
+from pytamaro.color_functions import rgb_color
+from pytamaro.color_names import blue, red
+from pytamaro.graphic import Ellipse, Rectangle
+from pytamaro.primitives import rectangle, text
+
+from tests.testing_utils import HEIGHT, WIDTH
+
+
+def test_bounds_not_shared():
+    r = rectangle(WIDTH, HEIGHT, red)
+    bounds = r.bounds()
+    bounds.offset(WIDTH, HEIGHT)
+    assert r.bounds() == Rect.MakeWH(WIDTH, HEIGHT)
+    size = r.size()
+    size.set(0, 0)
+    assert r.size() == Size(WIDTH, HEIGHT)
+
+
+def test_empty_area_computed_once():
+    r = rectangle(WIDTH, HEIGHT, red)
+    reset_cache_stats()
+    for _ in range(3):
+        assert not r.empty_area()
+    assert cache_stats()["Graphic.empty_area"].misses == 1
+    assert cache_stats()["Graphic.empty_area"].hits == 2
+
+
+def test_paint_shared_by_color():
+    reset_cache_stats()
+    r = Rectangle(WIDTH, HEIGHT, red)
+    e = Ellipse(WIDTH, HEIGHT, rgb_color(255, 0, 0))
+    assert r.paint is e.paint
+    assert Rectangle(WIDTH, HEIGHT, blue).paint is not r.paint
+    assert cache_stats()["paints"].hits >= 1
+
+
+@fixture
+def cache_name(request):
+    # A name used only by the current test, unregistered afterwards: caches
+    # with the same name share their statistics.
+    name = f"test:{request.node.name}"
+    yield name
+    _caches.pop(name, None)
+    _stats.pop(name, None)
+
+
+def test_lru_cache_evicts_least_recently_used(cache_name):
+    cache = LRUCache(cache_name, 2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 0)
+    cache.get("c", lambda: 3)
+    assert len(cache) == 2
+    assert cache.get("a", lambda: 0) == 1
+    assert cache.get("b", lambda: 0) == 0
+    assert (cache.stats.hits, cache.stats.misses) == (2, 4)
+
+
+def test_lru_cache_capacity(cache_name):
+    cache = LRUCache(cache_name, 3)
+    for key in "abc":
+        cache.get(key, lambda: 1)
+    set_cache_capacity(cache_name, 1)
+    assert len(cache) == 1
+    assert cache.get("c", lambda: 0) == 1
+
+
+def test_text_outline_cached():
+    t = text("cached", "", 17, red)
+    reset_cache_stats()
+    assert text("cached", "", 17, blue).path is t.path
+    assert cache_stats()["text_paths"].hits == 1
+
+
+def test_glyph_outlines_cached():
+    text("abc", "", 19, red)
+    reset_cache_stats()
+    text("cab", "", 19, red)
+    stats = cache_stats()
+    assert stats["fonts"].hits == 1
+    assert stats["glyph_paths"].hits == 3
+    assert stats["glyph_paths"].misses == 0
@@ -2,6 +2,7 @@ from pytamaro.color import Color
 from PIL.ImageColor import getrgb
 from pytamaro.color_functions import hsv_color, hsl_color
 from pytamaro.color_names import *
+from pytest import raises
 
 
 def _same_color(color: Color, name: str):
@@ -49,3 +50,22 @@ def test_hsv_rbg_conversion():
     assert hsv_color(300, 1, 1) == rgb_color(255, 0, 255)  # magenta
     assert hsv_color(0, 0, 1) == rgb_color(255, 255, 255)  # white
     assert hsv_color(0, 0, 0) == rgb_color(0, 0, 0)        # black
+
+
+def test_color_hashable():
+    assert len({rgb_color(255, 0, 0), red, hsv_color(0, 1, 1)}) == 1
+
+
+def test_color_immutable():
+    with raises(AttributeError):
+        red.color = blue.color  # type: ignore
+
+
+def test_color_as_tuple():
+    assert rgb_color(1, 2, 3, 0.0).as_tuple() == (1, 2, 3, 0.0)
+    assert rgb_color(1, 2, 3).as_tuple() == (1, 2, 3, 1.0)
+
+
+def test_color_components_out_of_range():
+    assert Color(256, 0, 0, 1.0) == Color(255, 0, 0, 1.0)
+    assert Color(-3, 300, 7, 1.5).as_tuple() == (0, 255, 7, 1.0)
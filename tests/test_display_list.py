@@ -0,0 +1,143 @@
+from functools import reduce
+
+from skia import Rect, Surface
+
+from pytamaro.cache import reset_cache_stats
+from pytamaro.color_functions import rgb_color
+from pytamaro.color_names import blue, red
+from pytamaro.display_list import compile_graphic, draw_graphic, graphic_picture
+from pytamaro.graphic import Graphic, Text, culling_stats
+from pytamaro.io import graphic_to_image
+from pytamaro.operations import beside, compose, overlay, rotate
+from pytamaro.primitives import ellipse, empty_graphic, rectangle
+
+from tests.testing_utils import HEIGHT, WIDTH
+
+
+def test_compile_one_operation_per_primitive():
+    g = beside(rectangle(WIDTH, HEIGHT, red), rotate(30, ellipse(WIDTH, HEIGHT, blue)))
+    assert len(compile_graphic(beside(g, empty_graphic()))) == 2
+
+
+def test_compile_cached():
+    g = beside(rectangle(WIDTH, HEIGHT, red), ellipse(WIDTH, HEIGHT, blue))
+    assert compile_graphic(g) is compile_graphic(g)
+
+
+def test_replay_same_as_draw():
+    g = beside(rectangle(WIDTH, HEIGHT, red), rotate(30, ellipse(WIDTH, HEIGHT, blue)))
+    _assert_replay_same_as_draw(g)
+
+
+def _assert_replay_same_as_draw(g: Graphic):
+    bounds = g.bounds()
+    int_size = g.size().toCeil()
+    surface = Surface(int_size.width(), int_size.height())
+    canvas = surface.getCanvas()
+    canvas.translate(-bounds.left(), -bounds.top())
+    g.draw(canvas)
+    assert surface.makeImageSnapshot().tobytes() == graphic_to_image(g).tobytes()
+
+
+def test_replay_native_text():
+    t = Text("hello", "", 12, red, True)
+    g = beside(t, beside(rectangle(WIDTH, HEIGHT, red), rotate(30, t)))
+    assert len(compile_graphic(g)) == 3
+    _assert_replay_same_as_draw(g)
+
+
+def test_replay_scaled():
+    r = rectangle(WIDTH, HEIGHT, red)
+    surface = Surface(2 * WIDTH, 2 * HEIGHT)
+    canvas = surface.getCanvas()
+    canvas.scale(2, 2)
+    compile_graphic(r).draw(canvas)
+    bitmap = surface.makeImageSnapshot().bitmap()
+    assert bitmap.getColor(2 * WIDTH - 1, 2 * HEIGHT - 1) == int(red.color)
+
+
+def test_replay_culls_outside_clip():
+    g = beside(rectangle(WIDTH, HEIGHT, red), ellipse(WIDTH, HEIGHT, blue))
+    surface = Surface(2 * WIDTH, HEIGHT)
+    canvas = surface.getCanvas()
+    canvas.clipRect(Rect.MakeWH(WIDTH // 2, HEIGHT))
+    canvas.translate(-g.bounds().left(), -g.bounds().top())
+    reset_cache_stats()
+    compile_graphic(g).draw(canvas)
+    # The ellipse lies outside of the clip, hence it is not drawn.
+    assert (culling_stats.hits, culling_stats.misses) == (1, 1)
+    assert surface.makeImageSnapshot().bitmap().getColor(0, 0) == int(red.color)
+
+
+def test_draw_culls_outside_clip():
+    g = beside(rectangle(WIDTH, HEIGHT, red), beside(ellipse(WIDTH, HEIGHT, blue),
+                                                     ellipse(WIDTH, HEIGHT, red)))
+    canvas = Surface(WIDTH, HEIGHT).getCanvas()
+    canvas.translate(-g.bounds().left(), -g.bounds().top())
+    reset_cache_stats()
+    g.draw(canvas)
+    # The ellipses are culled together, as a single subtree.
+    assert culling_stats.hits == 1
+
+
+def test_shared_subtree_replayed_as_picture():
+    tile = beside(rectangle(WIDTH, HEIGHT, red), ellipse(WIDTH, HEIGHT, blue))
+    g = beside(tile, rotate(30, tile))
+    assert len(compile_graphic(g)) == 3
+    _assert_replay_same_as_draw(g)
+
+
+def test_picture_recorded_once():
+    g = beside(rectangle(WIDTH, HEIGHT, red), ellipse(WIDTH, HEIGHT, blue))
+    assert compile_graphic(g).picture() is compile_graphic(g).picture()
+    assert graphic_picture(g) is compile_graphic(g).picture()
+
+
+def test_picture_recorded_when_drawn_again():
+    g = beside(rectangle(WIDTH, HEIGHT, red), ellipse(WIDTH, HEIGHT, blue))
+    canvas = Surface(2 * WIDTH, HEIGHT).getCanvas()
+    draw_graphic(canvas, g)
+    # Drawn once: neither compiled nor recorded.
+    assert "_display_list" not in g.__dict__ and "_picture" not in g.__dict__
+    draw_graphic(canvas, g)
+    assert graphic_picture(g) is compile_graphic(g).picture()
+    _assert_replay_same_as_draw(g)
+
+
+def test_picture_merges_primitives():
+    row = reduce(beside, [rectangle(WIDTH, HEIGHT, red) for _ in range(10)])
+    canvas = Surface(10 * WIDTH, HEIGHT).getCanvas()
+    draw_graphic(canvas, row)
+    draw_graphic(canvas, row)
+    # A single path filled, rather than one for each rectangle.
+    assert graphic_picture(row).approximateOpCount() < 10
+
+
+def test_repeated_subtree_replayed_when_drawn():
+    def tile():
+        return compose(rectangle(WIDTH, HEIGHT, red), rotate(30, ellipse(WIDTH, HEIGHT, blue)))
+    t = tile()
+    grid = reduce(beside, [t] * 4)
+    copies = reduce(beside, [tile() for _ in range(4)])
+    assert graphic_to_image(grid).tobytes() == graphic_to_image(copies).tobytes()
+    # Drawn once, then recorded when met again and replayed afterwards.
+    assert "_picture" in t.__dict__
+
+
+def test_batch_same_paint_disjoint():
+    r = rectangle(WIDTH, HEIGHT, red)
+    row = reduce(beside, [r] * 10)
+    assert len(compile_graphic(row)) == 1
+    _assert_replay_same_as_draw(row)
+
+
+def test_no_batch_overlapping():
+    translucent = rgb_color(255, 0, 0, 0.5)
+    g = overlay(rectangle(WIDTH, HEIGHT, translucent), rectangle(HEIGHT, WIDTH, translucent))
+    assert len(compile_graphic(g)) == 2
+    _assert_replay_same_as_draw(g)
+
+
+def test_no_batch_different_paint():
+    g = beside(rectangle(WIDTH, HEIGHT, red), rectangle(WIDTH, HEIGHT, blue))
+    assert len(compile_graphic(g)) == 2
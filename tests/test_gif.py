@@ -0,0 +1,54 @@
+from io import BytesIO
+
+import PIL.GifImagePlugin
+from pytest import mark
+
+from pytamaro import gif
+from pytamaro.color_names import blue, red
+from pytamaro.gif import GifWriter
+from pytamaro.io import graphic_to_pillow_image
+from pytamaro.operations import rotate
+from pytamaro.primitives import rectangle
+
+from tests.testing_utils import HEIGHT, WIDTH
+
+
+def _frames():
+    graphics = [rectangle(WIDTH, HEIGHT, red)] * 2 + \
+        [rotate(angle, rectangle(WIDTH, HEIGHT, blue)) for angle in range(0, 90, 30)]
+    return [graphic_to_pillow_image(g) for g in graphics]
+
+
+def _written(frames):
+    file = BytesIO()
+    writer = GifWriter(file, 40, 0)
+    for frame in frames:
+        writer.write(frame)
+    writer.close()
+    return file.getvalue()
+
+
+def test_pillow_gif_helpers():
+    # GifWriter relies on these private Pillow functions: fail loudly if they
+    # disappear or change, instead of silently falling back to saving all
+    # frames at once.
+    for name in ("_get_global_header", "_normalize_mode", "_normalize_palette",
+                 "_write_frame_data"):
+        assert callable(getattr(PIL.GifImagePlugin, name))
+    assert gif.INCREMENTAL
+
+
+def test_gif_writer_falls_back(monkeypatch):
+    monkeypatch.delattr(PIL.GifImagePlugin, "_get_global_header")
+    assert not gif._same_as_pillow()
+
+
+@mark.parametrize("incremental", [True, False])
+@mark.parametrize("count", [1, 5])
+def test_gif_writer_same_as_pillow(monkeypatch, incremental, count):
+    monkeypatch.setattr(gif, "INCREMENTAL", incremental)
+    frames = _frames()[:count]
+    saved = BytesIO()
+    frames[0].save(saved, format="GIF", save_all=True, append_images=frames[1:],
+                   duration=40, loop=0)
+    assert _written(frames) == saved.getvalue()
@@ -1,4 +1,9 @@
+from functools import reduce
+
 from pytamaro.color_names import blue, red
+from pytamaro.graphic import set_interning
+from pytamaro.operations import beside, compose, pin
+from pytamaro.point_names import top_left
 from pytamaro.primitives import empty_graphic, rectangle
 
 from tests.testing_utils import HEIGHT, WIDTH
@@ -58,3 +63,49 @@ def test_hash_empty_graphic():
 def test_empty_area_not_empty_graphic():
     g = rectangle(0, HEIGHT, red)
     assert g.empty_area()
+
+
+def test_path_deeply_nested_compose():
+    r = rectangle(WIDTH, HEIGHT, red)
+    graphic = reduce(compose, [r] * 10000, empty_graphic())
+    bounds = graphic.path.computeTightBounds()
+    assert (bounds.width(), bounds.height()) == (WIDTH, HEIGHT)
+
+
+def test_bounds_zero_width_component():
+    g = beside(rectangle(0, HEIGHT, red), rectangle(WIDTH, WIDTH, blue))
+    assert (g.size().width(), g.size().height()) == (WIDTH, HEIGHT)
+
+
+def test_bounds_empty_component():
+    g = compose(empty_graphic(), pin(top_left, rectangle(WIDTH, HEIGHT, red)))
+    assert g.bounds() == rectangle(WIDTH, HEIGHT, red).bounds()
+
+
+def test_equality_composed():
+    r = rectangle(WIDTH, HEIGHT, red)
+    e = rectangle(WIDTH, HEIGHT, blue)
+    assert beside(r, e) == beside(rectangle(WIDTH, HEIGHT, red), e)
+    assert beside(r, e) != beside(e, r)
+    assert beside(r, e) != compose(r, e)
+
+
+def test_equality_deeply_nested():
+    r1 = rectangle(WIDTH, HEIGHT, red)
+    r2 = rectangle(WIDTH, HEIGHT, red)
+    g1 = reduce(beside, [r1] * 10000, empty_graphic())
+    g2 = reduce(beside, [r2] * 10000, empty_graphic())
+    assert g1 == g2
+    assert hash(g1) == hash(g2)
+
+
+def test_interning():
+    set_interning(True)
+    try:
+        r = rectangle(WIDTH, HEIGHT, red)
+        assert rectangle(WIDTH, HEIGHT, red) is r
+        assert rectangle(WIDTH, HEIGHT, blue) is not r
+        assert beside(r, r) is beside(rectangle(WIDTH, HEIGHT, red), r)
+    finally:
+        set_interning(False)
+    assert rectangle(WIDTH, HEIGHT, red) is not rectangle(WIDTH, HEIGHT, red)
@@ -1,11 +1,16 @@
+from io import BytesIO
 from tempfile import NamedTemporaryFile
 
 from PIL import Image as ImageMod
 from pytamaro.color_names import blue, red
-from pytamaro.io import save_animation, save_graphic, show_animation, show_graphic
+from pytamaro.graphic import Text
+from pytamaro.io import (encode_animation, encode_graphic, graphic_to_image,
+                         graphic_to_svg_bytes, save_animation, save_graphic,
+                         show_animation, show_graphic, write_animation,
+                         _Base64Writer)
 from pytamaro.primitives import empty_graphic, rectangle
 from pytest import raises
-from pytamaro.operations import beside
+from pytamaro.operations import beside, compose, rotate
 
 from tests.testing_utils import HEIGHT, WIDTH, assert_SVG_file_width_height
 
@@ -57,6 +62,42 @@ def test_save_animation():
         assert gif.n_frames == 2
 
 
+def test_save_animation_in_parallel():
+    graphics = [rotate(angle, rectangle(WIDTH, HEIGHT, red)) for angle in range(0, 90, 10)]
+    with NamedTemporaryFile(suffix=".gif") as serial, NamedTemporaryFile(suffix=".gif") as parallel:
+        save_animation(serial.name, graphics)
+        save_animation(parallel.name, graphics, workers=3)
+        assert serial.read() == parallel.read()
+
+
+def test_save_animation_in_parallel_keeps_graphics():
+    graphics = [rotate(angle, rectangle(WIDTH, HEIGHT, red)) for angle in range(0, 90, 30)]
+    encode_animation(graphics, workers=2)
+    assert all("_picture" not in graphic.__dict__ for graphic in graphics)
+
+
+def test_save_animation_invalid_workers():
+    graphics = [rectangle(WIDTH, HEIGHT, red)]
+    with raises(ValueError):
+        save_animation("foo.gif", graphics, workers=-5)
+    with raises(ValueError):
+        encode_animation(graphics, workers=0)
+
+
+def test_write_animation_from_generator():
+    graphics = [rectangle(WIDTH, HEIGHT, red)] * 2 + [rotate(angle, rectangle(WIDTH, HEIGHT, blue)) for angle in range(0, 90, 30)]
+    with NamedTemporaryFile(suffix=".gif") as saved, NamedTemporaryFile(suffix=".gif") as written:
+        save_animation(saved.name, graphics)
+        write_animation(written.name, (graphic for graphic in graphics))
+        assert saved.read() == written.read()
+        assert ImageMod.open(written.name).n_frames == 4
+
+
+def test_write_empty_animation():
+    with raises(ValueError):
+        write_animation("foo.gif", iter([]))
+
+
 def test_save_graphic_PNG():
     r = rectangle(WIDTH, HEIGHT, red)
     with NamedTemporaryFile() as f:
@@ -81,6 +122,46 @@ def test_save_graphic_SVG():
         assert_SVG_file_width_height(filename, WIDTH, HEIGHT)
 
 
+def test_graphic_to_svg_bytes():
+    r = rectangle(WIDTH, HEIGHT, red)
+    content = graphic_to_svg_bytes(r)
+    with NamedTemporaryFile() as f:
+        filename = f"{f.name}.svg"
+        save_graphic(filename, r)
+        with open(filename, "rb") as svg:
+            assert svg.read() == content
+    assert content.count(b'shape-rendering="crispEdges"') == 1
+    assert b'fill="none"/>' in graphic_to_svg_bytes(empty_graphic())
+
+
+def test_encode_graphic():
+    r = rectangle(WIDTH, HEIGHT, red)
+    assert ImageMod.open(BytesIO(encode_graphic(r, "png"))).size == (WIDTH, HEIGHT)
+    assert encode_graphic(r, "svg") == graphic_to_svg_bytes(r)
+    with raises(ValueError):
+        encode_graphic(r, "bmp")
+    with raises(ValueError):
+        encode_graphic(empty_graphic(), "png")
+
+
+def test_encode_animation():
+    graphics = [rectangle(WIDTH, HEIGHT, red), rectangle(WIDTH, HEIGHT, blue)]
+    with NamedTemporaryFile(suffix=".gif") as f:
+        save_animation(f.name, graphics)
+        assert encode_animation(iter(graphics)) == f.read()
+    with raises(ValueError):
+        encode_animation([])
+
+
+def test_save_native_text_SVG():
+    t = Text("hello", "", 12, red, True)
+    with NamedTemporaryFile() as f:
+        filename = f"{f.name}.svg"
+        save_graphic(filename, t)
+        with open(filename, encoding="utf-8") as svg:
+            assert "hello" in svg.read()
+
+
 def test_save_graphic_wrong_no_ext():
     r = rectangle(WIDTH, HEIGHT, red)
     with NamedTemporaryFile() as f:
@@ -117,6 +198,48 @@ def test_data_uri_output(capfd):
     del os.environ[VAR]
 
 
+def test_large_data_uri_output(capfd):
+    import os
+    from base64 import b64encode
+
+    VAR = "PYTAMARO_OUTPUT_DATA_URI"
+    os.environ[VAR] = "True"
+    graphics = [rotate(angle, rectangle(300, 200, red)) for angle in range(0, 90, 15)]
+    show_graphic(graphics[1])
+    show_animation(graphics)
+    out, _ = capfd.readouterr()
+    png = b64encode(encode_graphic(graphics[1], "png")).decode()
+    gif = b64encode(encode_animation(graphics)).decode()
+    assert (
+        out == f"{PREFIX}data:image/png;base64,{png}{SUFFIX}{PREFIX}data:image/gif;base64,{gif}{SUFFIX}"
+    )
+    del os.environ[VAR]
+
+
+def test_data_uri_output_failure(capfd):
+    from pytamaro.io import _data_uri_output
+
+    with raises(RuntimeError):
+        with _data_uri_output("image/png") as output:
+            output.write(b"partial")
+            raise RuntimeError()
+    out, _ = capfd.readouterr()
+    assert out.startswith(PREFIX) and SUFFIX not in out
+
+
+def test_base64_writer_chunks():
+    from base64 import b64encode
+    from io import StringIO
+
+    output = StringIO()
+    writer = _Base64Writer(output)
+    data = bytes(range(256)) * 3
+    for start, end in [(0, 1), (1, 2), (2, 7), (7, 7), (7, 500), (500, len(data))]:
+        writer.write(data[start:end])
+    writer.close()
+    assert output.getvalue() == b64encode(data).decode()
+
+
 def test_multiple_data_uri_mixed_output(capfd):
     import os
 
@@ -156,3 +279,13 @@ def test_show_deeply_nested_graphic():
     graphic = reduce(beside, [element] * 1000, empty_graphic())
     # Implicitly assert that it does not throw
     show_graphic(graphic)
+
+
+def test_draw_very_deeply_nested_graphic():
+    import sys
+    from functools import reduce
+    element = rectangle(WIDTH, HEIGHT, red)
+    graphic = reduce(compose, [element] * 50000, empty_graphic())
+    recursion_limit = sys.getrecursionlimit()
+    assert graphic_to_image(graphic).width() == WIDTH
+    assert sys.getrecursionlimit() == recursion_limit
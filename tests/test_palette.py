@@ -0,0 +1,60 @@
+from pytest import importorskip, raises
+
+from pytamaro.color_functions import hsl_color, hsv_color, rgb_color
+
+np = importorskip("numpy")
+
+from pytamaro.palette import Palette, hsl_palette, hsv_palette, rgb_palette  # noqa: E402
+
+
+def test_rgb_palette():
+    palette = rgb_palette([255, 0], [0, 128], np.array([0, 255]), [1, 0.5])
+    assert len(palette) == 2
+    assert palette[0] == rgb_color(255, 0, 0)
+    assert palette[1] == rgb_color(0, 128, 255, 0.5)
+
+
+def test_palette_from_single_values():
+    assert list(rgb_palette(10, 20, 30)) == [rgb_color(10, 20, 30)]
+
+
+def test_palette_slice():
+    palette = rgb_palette(np.arange(10), 0, 0)
+    assert isinstance(palette[2:5], Palette)
+    assert list(palette[2:5]) == [rgb_color(red, 0, 0) for red in range(2, 5)]
+
+
+def test_hsv_palette_same_as_hsv_color():
+    rng = np.random.default_rng(42)
+    hues = np.concatenate([np.arange(0, 361, 15.0), rng.uniform(0, 360, 1000)])
+    saturations = rng.uniform(0, 1, len(hues))
+    values = rng.uniform(0, 1, len(hues))
+    palette = hsv_palette(hues, saturations, values, 0.25)
+    for color, hue, saturation, value in zip(palette, hues.tolist(),
+                                             saturations.tolist(), values.tolist()):
+        assert color == hsv_color(hue, saturation, value, 0.25)
+
+
+def test_hsl_palette_same_as_hsl_color():
+    rng = np.random.default_rng(42)
+    hues = np.concatenate([np.arange(0, 361, 15.0), rng.uniform(0, 360, 1000)])
+    saturations = rng.uniform(0, 1, len(hues))
+    lightnesses = rng.uniform(0, 1, len(hues))
+    palette = hsl_palette(hues, saturations, lightnesses)
+    for color, hue, saturation, lightness in zip(palette, hues.tolist(),
+                                                 saturations.tolist(), lightnesses.tolist()):
+        assert color == hsl_color(hue, saturation, lightness)
+
+
+def test_palette_out_of_range():
+    with raises(ValueError, match=r"\[0, 360\]"):
+        hsv_palette([0, 361], 1, 1)
+    with raises(ValueError, match=r"\[0, 1\]"):
+        rgb_palette(0, 0, 0, [0.5, 1.5])
+    with raises(ValueError, match=r"\[0, 1\]"):
+        hsl_palette(0, [np.nan], 0.5)
+
+
+def test_palette_invalid_type():
+    with raises(TypeError):
+        rgb_palette(["red"], 0, 0)
@@ -3,6 +3,7 @@ from collections import Counter
 from pytest import raises
 
 from pytamaro.color_names import blue, red
+from pytamaro.graphic import Text, set_native_text
 from pytamaro.operations import (above, compose, graphic_height, graphic_width,
                                  rotate)
 from pytamaro.primitives import (circular_sector, ellipse, empty_graphic,
@@ -41,6 +42,21 @@ def test_text():
     assert_unique_color(graphic, red)
 
 
+def test_native_text():
+    set_native_text(True)
+    try:
+        native = text("hello", "", 12, red)
+    finally:
+        set_native_text(False)
+    outlined = text("hello", "", 12, red)
+    assert isinstance(native, Text) and isinstance(outlined, Text)
+    assert native.native and not outlined.native
+    assert native != outlined
+    assert native.bounds() == outlined.bounds()
+    assert native.pin_position == outlined.pin_position
+    assert_unique_color(native, red)
+
+
 def test_circular_sector_0_deg():
     s = circular_sector(RADIUS, 0, red)
     assert_size(s, (RADIUS, 0))
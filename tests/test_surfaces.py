@@ -0,0 +1,49 @@
+from skia import ColorType
+
+from pytamaro.color_names import blue, red
+from pytamaro.io import graphic_to_image, graphic_to_pillow_image
+from pytamaro.primitives import rectangle
+from pytamaro.surfaces import SurfacePool, surface_pool
+
+from tests.testing_utils import HEIGHT, WIDTH
+
+
+def test_surface_reused():
+    pool = SurfacePool(1024 * 1024)
+    # Statistics are shared by all the pools.
+    pool.stats.reset()
+    with pool.surface(WIDTH, HEIGHT) as surface:
+        pass
+    with pool.surface(WIDTH, HEIGHT) as reused:
+        assert reused is surface
+    with pool.surface(WIDTH, HEIGHT, ColorType.kRGBA_8888_ColorType) as other:
+        assert other is not surface
+    assert (pool.stats.hits, pool.stats.misses) == (1, 2)
+
+
+def test_surface_cleared():
+    pool = SurfacePool(1024 * 1024)
+    with pool.surface(WIDTH, HEIGHT) as surface:
+        surface.getCanvas().clear(int(red.color))
+        surface.getCanvas().translate(WIDTH, HEIGHT)
+    with pool.surface(WIDTH, HEIGHT) as surface:
+        assert surface.getCanvas().getTotalMatrix().isIdentity()
+        assert surface.makeImageSnapshot().bitmap().getColor(0, 0) == 0
+
+
+def test_pool_capacity():
+    pool = SurfacePool(2 * WIDTH * HEIGHT * 4)
+    with pool.surface(WIDTH, HEIGHT), pool.surface(WIDTH, HEIGHT), pool.surface(WIDTH, HEIGHT):
+        pass
+    assert len(pool) == 2
+    assert pool.size == 2 * WIDTH * HEIGHT * 4
+    pool.set_capacity(0)
+    assert len(pool) == 0
+
+
+def test_image_not_affected_by_reuse():
+    image = graphic_to_image(rectangle(WIDTH, HEIGHT, red))
+    graphic_to_pillow_image(rectangle(WIDTH, HEIGHT, blue))
+    graphic_to_image(rectangle(WIDTH, HEIGHT, blue))
+    assert image.bitmap().getColor(0, 0) == int(red.color)
+    assert len(surface_pool) > 0
@@ -0,0 +1,74 @@
+import mmap
+from io import BytesIO
+from tempfile import NamedTemporaryFile
+
+from PIL import Image as ImageMod
+from pytest import mark, raises
+
+from pytamaro.color_functions import rgb_color
+from pytamaro.color_names import blue, green, red
+from pytamaro.io import graphic_to_pillow_image
+from pytamaro.operations import above, beside, rotate
+from pytamaro.primitives import ellipse, empty_graphic, rectangle, triangle
+from pytamaro.tiles import graphic_to_buffer, save_tiled_graphic, write_tiled_PNG
+
+from tests.testing_utils import HEIGHT, WIDTH
+
+
+def _grid():
+    row = beside(rectangle(WIDTH, HEIGHT, red), rectangle(WIDTH, HEIGHT, rgb_color(0, 0, 255, 0.5)))
+    return above(row, beside(rectangle(WIDTH, HEIGHT, green), rectangle(WIDTH // 2, HEIGHT, blue)))
+
+
+@mark.parametrize("tile_size", [7, 16, 1024])
+def test_graphic_to_buffer(tile_size):
+    g = _grid()
+    buffer = bytearray(2 * WIDTH * 2 * HEIGHT * 4)
+    graphic_to_buffer(g, buffer, tile_size)
+    assert buffer == graphic_to_pillow_image(g).tobytes()
+
+
+def test_graphic_to_memory_mapped_buffer():
+    g = _grid()
+    with mmap.mmap(-1, 2 * WIDTH * 2 * HEIGHT * 4) as buffer:
+        graphic_to_buffer(g, buffer, 16)
+        assert buffer[:] == graphic_to_pillow_image(g).tobytes()
+
+
+@mark.parametrize("tile_size", [7, 16, 1024])
+def test_write_tiled_PNG(tile_size):
+    g = above(beside(ellipse(WIDTH, HEIGHT, red), rectangle(WIDTH, HEIGHT, blue)),
+              rotate(30, triangle(WIDTH, HEIGHT, 60, green)))
+    buffer = bytearray(g.size().toCeil().width() * g.size().toCeil().height() * 4)
+    graphic_to_buffer(g, buffer, tile_size)
+    file = BytesIO()
+    write_tiled_PNG(file, g, tile_size)
+    image = ImageMod.open(BytesIO(file.getvalue()))
+    assert image.mode == "RGBA"
+    assert image.size == g.size().toCeil()
+    assert image.tobytes() == buffer
+
+
+def test_save_tiled_graphic():
+    g = _grid()
+    with NamedTemporaryFile(suffix=".png") as f:
+        save_tiled_graphic(f.name, g, 16)
+        assert ImageMod.open(f.name).tobytes() == graphic_to_pillow_image(g).tobytes()
+
+
+def test_tiled_empty_graphic():
+    with raises(ValueError):
+        write_tiled_PNG(BytesIO(), empty_graphic())
+    with raises(ValueError):
+        graphic_to_buffer(rectangle(0, HEIGHT, red), bytearray(0))
+
+
+@mark.parametrize("tile_size", [0, -16])
+def test_tiled_invalid_tile_size(tile_size):
+    with raises(ValueError):
+        write_tiled_PNG(BytesIO(), _grid(), tile_size)
+
+
+def test_graphic_to_small_buffer():
+    with raises(ValueError):
+        graphic_to_buffer(_grid(), bytearray(2 * WIDTH * 2 * HEIGHT * 4 - 1))